@@ -0,0 +1,77 @@
+import functools
+import inspect
+from typing import Callable, Dict, Optional, Type, Union
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+
+# A status code, or a function building the HTTPException for the error
+ErrorResponse = Union[int, Callable[[Exception], HTTPException]]
+ErrorMap = Dict[Type[Exception], ErrorResponse]
+
+
+def _http_exception(exc: Exception, errors: ErrorMap) -> Optional[HTTPException]:
+    """HTTPException for the most specific class in exc's MRO that errors maps"""
+    for exc_type in type(exc).__mro__:
+        if exc_type in errors:
+            response = errors[exc_type]
+            if isinstance(response, int):
+                return HTTPException(status_code=response, detail=str(exc))
+            return response(exc)
+    return None
+
+
+def _map_errors(endpoint: Callable, errors: ErrorMap) -> Callable:
+    """Wrap an endpoint so the errors it raises become HTTPExceptions"""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                http_exc = _http_exception(e, errors)
+                if http_exc is None:
+                    raise
+                raise http_exc from e
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        try:
+            return endpoint(*args, **kwargs)
+        except HTTPException:
+            raise
+        except Exception as e:
+            http_exc = _http_exception(e, errors)
+            if http_exc is None:
+                raise
+            raise http_exc from e
+    return wrapper
+
+
+def error_route_class(
+    errors: ErrorMap,
+    overrides: Optional[Dict[str, ErrorMap]] = None
+) -> Type[APIRoute]:
+    """
+    Route class mapping service errors to HTTP responses for one router.
+
+    Args:
+        errors: Exception type -> status code (or HTTPException factory) for
+            every endpoint of the router
+        overrides: Endpoint name -> entries that replace or extend errors for
+            that endpoint only
+
+    Only the endpoint call is wrapped, so request validation errors and the
+    HTTPExceptions endpoints raise themselves pass through unchanged.
+    """
+    overrides = overrides or {}
+
+    class ErrorMappingRoute(APIRoute):
+        def __init__(self, path: str, endpoint: Callable, **kwargs):
+            endpoint_errors = {**errors, **overrides.get(endpoint.__name__, {})}
+            super().__init__(path, _map_errors(endpoint, endpoint_errors), **kwargs)
+
+    return ErrorMappingRoute
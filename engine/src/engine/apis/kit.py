@@ -1,7 +1,7 @@
 from typing import List
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from engine.auth.dependencies import ACT_CREATE, ACT_DELETE, ACT_LIST, ACT_READ, OBJ_KIT, require_action
@@ -43,6 +43,23 @@ class KitResponse(BaseModel):
         )
 
 
+class KitInstallResponse(BaseModel):
+    status: str
+    message: str
+    kit_info: KitResponse
+
+
+def _kit_installed_response(message: str, metadata: KitMetadata) -> Response:
+    """Serialize the install/upload result in one pass with pydantic's JSON
+    encoder instead of .dict() followed by JSONResponse's json.dumps"""
+    body = KitInstallResponse(
+        status="success",
+        message=message,
+        kit_info=KitResponse.from_metadata(metadata)
+    ).model_dump_json()
+    return Response(content=body, media_type="application/json")
+
+
 class KitListResponse(BaseModel):
     kits: List[KitResponse]
 
@@ -109,13 +126,7 @@ class KitRouter:
                 kit_file.file
             )
 
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Kit uploaded successfully",
-                    "kit_info": KitResponse.from_metadata(metadata).dict()
-                }
-            )
+            return _kit_installed_response("Kit uploaded successfully", metadata)
 
         except InvalidVersionError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -180,13 +191,7 @@ class KitRouter:
         """Install kit from registry"""
         try:
             metadata = self.service.install_kit(owner, kit_id, version)
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Kit installed successfully",
-                    "kit_info": KitResponse.from_metadata(metadata).dict()
-                }
-            )
+            return _kit_installed_response("Kit installed successfully", metadata)
         except InvalidVersionError as e:
             raise HTTPException(status_code=400, detail=str(e))
         except KitNotFoundError as e:
@@ -246,13 +251,7 @@ class KitRouter:
                 kit_file.file
             )
 
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Kit uploaded and installed successfully",
-                    "kit_info": KitResponse.from_metadata(metadata).dict()
-                }
-            )
+            return _kit_installed_response("Kit uploaded and installed successfully", metadata)
 
         except InvalidVersionError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -1,7 +1,7 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from engine.auth.dependencies import ACT_EXECUTE, ACT_LIST, ACT_READ, ACT_UPDATE, OBJ_MODEL, require_action
 from engine.services.execution.model import ModelService
@@ -11,6 +11,17 @@ class SetModelRequest(BaseModel):
     model_name: str
 
 
+class ChatCompletionRequest(BaseModel):
+    """Request model for chat completion; extra fields are passed through to the model"""
+    model_config = ConfigDict(extra="allow")
+
+    messages: List[Dict[str, Any]]
+    stream: bool = False
+    tools: Optional[List[Dict[str, Any]]] = None
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None
+    model: Optional[str] = None
+
+
 class ModelRouter:
     """FastAPI router for model endpoints"""
 
@@ -47,10 +58,11 @@ class ModelRouter:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def _chat_completion(self, request: Dict[str, Any]):
+    async def _chat_completion(self, request: ChatCompletionRequest):
         """Handle chat completion request"""
         try:
-            response = await self.service.chat_completion(**request)
+            # Only forward what the client sent, so service defaults still apply
+            response = await self.service.chat_completion(**request.model_dump(exclude_unset=True))
             return response
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
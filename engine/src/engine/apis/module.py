@@ -3,13 +3,14 @@ import re
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, field_serializer, validator
 from sqlalchemy import UUID
 
 from engine.auth.dependencies import ACT_CREATE, ACT_DELETE, ACT_LIST, ACT_READ, ACT_UPDATE, OBJ_MODULE, require_action
 from engine.db.models import ProvideType
 from engine.services.core.api_key import ApiKeyService
+from engine.apis.errors import error_route_class
 from engine.services.core.module import (
     ModuleError,
     ModuleMetadata,
@@ -134,6 +135,15 @@ class ModuleResponse(BaseModel):
 
 
 
+# ModuleResponse fields, read straight off ModuleMetadata by list endpoints that
+# return JSON directly instead of building a validated ModuleResponse per row
+_MODULE_FIELDS = tuple(ModuleResponse.model_fields)
+
+
+def _module_dict(metadata: ModuleMetadata) -> Dict[str, Any]:
+    return {field: getattr(metadata, field) for field in _MODULE_FIELDS}
+
+
 class ModuleGraphResponse(BaseModel):
     nodes: List[ModuleResponse]
     edges: List[Dict]
@@ -194,6 +204,17 @@ class ModuleProvideResponse(BaseModel):
 
 
 
+
+
+# ModuleError is a client error, except where deleting a module or building
+# the graph fails
+_ModuleErrorRoute = error_route_class(
+    {ModuleError: 400},
+    overrides={
+        "_delete_module": {ModuleError: 500},
+        "get_module_graph": {ModuleError: 500},
+    }
+)
 
 
 class ModuleRouter:
@@ -207,149 +228,129 @@ class ModuleRouter:
     ):
         self.service = module_service
         self.api_key_service = api_key_service
-        self.router = APIRouter(prefix=prefix, tags=["module"])
+        self.router = APIRouter(
+            prefix=prefix,
+            tags=["module"],
+            default_response_class=ORJSONResponse,
+            route_class=_ModuleErrorRoute
+        )
         self._setup_routes()
 
-    async def _create_module(self, request: CreateModuleRequest):
+    def _create_module(self, request: CreateModuleRequest):
         """Create module"""
-        try:
-            metadata = self.service.create_module(
-                project_id=request.project_id,
-                owner=request.owner,
-                kit_id=request.kit_id,
-                version=request.version,
-                env_vars=request.env_vars,
-                path=request.path,
-                module_name=request.module_name
-            )
-            return ModuleResponse.from_metadata(metadata)
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        metadata = self.service.create_module(
+            project_id=request.project_id,
+            owner=request.owner,
+            kit_id=request.kit_id,
+            version=request.version,
+            env_vars=request.env_vars,
+            path=request.path,
+            module_name=request.module_name
+        )
+        return ModuleResponse.from_metadata(metadata)
 
-    async def _delete_module(self, module_id: str):
+    def _delete_module(self, module_id: str):
         """Delete module"""
-        try:
-            self.service.delete_module(module_id)
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": f"module {module_id} deleted successfully"
-                }
-            )
-        except ModuleError as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        self.service.delete_module(module_id)
+        return {
+            "status": "success",
+            "message": f"module {module_id} deleted successfully"
+        }
 
-    async def _update_module_path(
+    def _update_module_path(
         self,
         module_id: str,
         request: UpdateModulePathRequest
     ):
         """Update module path for a specific module in a project"""
-        try:
-            self.service.update_module_path(
-                module_id=module_id,
-                project_id=request.project_id,
-                new_path=request.path
-            )
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Module path updated successfully"
-                }
-            )
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        self.service.update_module_path(
+            module_id=module_id,
+            project_id=request.project_id,
+            new_path=request.path
+        )
+        return {
+            "status": "success",
+            "message": "Module path updated successfully"
+        }
 
 
 
-    async def get_module_graph(self):
+    def get_module_graph(self):
         """Get module relationship graph"""
-        try:
-            graph = self.service.get_module_graph()
-
-            nodes = []
-            for node_id in graph.nodes:
-                attrs = graph.nodes[node_id]
-                if 'kit_id' not in attrs:
-                    continue
-
-                logger.info(attrs)
-                nodes.append(
-                    ModuleResponse(
-                        module_id=node_id,
-                        kit_id=attrs['kit_id'],
-                        module_name=attrs.get('module_name'),  # New field
-                        owner=attrs['owner'],
-                        version=attrs['version'],
-                        created_at=attrs['created_at'].isoformat(),
-                        env_vars=attrs['env_vars'],
-                        workspace_name=attrs['workspace_name'],
-                        project_id=attrs['project_id'],
-                        path=attrs['path']
-                    )
+        graph = self.service.get_module_graph()
+
+        nodes = []
+        for node_id in graph.nodes:
+            attrs = graph.nodes[node_id]
+            if 'kit_id' not in attrs:
+                continue
+
+            logger.info(attrs)
+            nodes.append(
+                ModuleResponse(
+                    module_id=node_id,
+                    kit_id=attrs['kit_id'],
+                    module_name=attrs.get('module_name'),  # New field
+                    owner=attrs['owner'],
+                    version=attrs['version'],
+                    created_at=attrs['created_at'].isoformat(),
+                    env_vars=attrs['env_vars'],
+                    workspace_name=attrs['workspace_name'],
+                    project_id=attrs['project_id'],
+                    path=attrs['path']
                 )
+            )
 
-            edges = []
-            for source, target, attrs in graph.edges(data=True):
-                edges.append({
-                    "source": source,
-                    "target": target,
-                    "type": attrs['type'],
-                    "created_at": attrs['created_at'],
-                    "description": attrs.get('description')
-                })
-
-            return ModuleGraphResponse(nodes=nodes, edges=edges)
+        edges = []
+        for source, target, attrs in graph.edges(data=True):
+            edges.append({
+                "source": source,
+                "target": target,
+                "type": attrs['type'],
+                "created_at": attrs['created_at'],
+                "description": attrs.get('description')
+            })
 
-        except ModuleError as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        return ModuleGraphResponse(nodes=nodes, edges=edges)
 
-    async def _get_project_modules(self, project_id: str):
+    def _get_project_modules(self, project_id: str):
         """Get all modules for a project"""
-        try:
-            modules = self.service.get_project_modules(project_id)
-            return [ModuleResponse.from_metadata(m) for m in modules]
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        # Rows come back as JSON-native dicts; returning the response directly
+        # skips building ModuleResponse models and response_model re-validation
+        return ORJSONResponse(self.service.get_project_modules_raw(project_id))
 
 
 
 
 
-    async def _update_module_env_var(
+    def _update_module_env_var(
         self,
         module_id: str,
         request: UpdateModuleEnvVarRequest
     ):
         """Update module environment variable"""
-        try:
-            metadata = self.service.update_module_env_var(
-                module_id=module_id,
-                env_var_name=request.env_var_name,
-                env_var_value=request.env_var_value
-            )
-            return ModuleResponse.from_metadata(metadata)
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        metadata = self.service.update_module_env_var(
+            module_id=module_id,
+            env_var_name=request.env_var_name,
+            env_var_value=request.env_var_value
+        )
+        return ModuleResponse.from_metadata(metadata)
 
-    async def _update_module_name(
+    def _update_module_name(
         self,
         module_id: str,
         request: UpdateModuleNameRequest
     ):
         """Update module name"""
-        try:
-            metadata = self.service.update_module_name(
-                module_id=module_id,
-                new_name=request.name
-            )
-            return ModuleResponse.from_metadata(metadata)
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        metadata = self.service.update_module_name(
+            module_id=module_id,
+            new_name=request.name
+        )
+        return ModuleResponse.from_metadata(metadata)
 
 
 
-    async def _create_or_reset_module_api_key(
+    def _create_or_reset_module_api_key(
         self, 
         module_id: str = Path(..., description="Module ID"),
         request: ApiKeyRequest = None
@@ -383,7 +384,7 @@ class ModuleRouter:
 
 
 
-    async def _create_module_provide(self, request: CreateModuleProvideRequest):
+    def _create_module_provide(self, request: CreateModuleProvideRequest):
         """Create a provide relationship between modules"""
         try:
             provide = self.service.create_module_provide(
@@ -402,126 +403,113 @@ class ModuleRouter:
                 updated_at=provide.updated_at.isoformat()
             )
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        except ModuleError as e:
+            # Missing provider/receiver; ModuleError is mapped by the route class
             raise HTTPException(status_code=400, detail=str(e))
 
-    async def _delete_module_provide(
+    def _delete_module_provide(
         self,
         provider_id: str,
         receiver_id: str,
         resource_type: ProvideType
     ):
         """Delete a provide relationship between modules"""
-        try:
-            result = self.service.delete_module_provide(
-                provider_id=provider_id,
-                receiver_id=receiver_id,
-                resource_type=resource_type
+        result = self.service.delete_module_provide(
+            provider_id=provider_id,
+            receiver_id=receiver_id,
+            resource_type=resource_type
+        )
+        
+        if not result:
+            raise HTTPException(
+                status_code=404, 
+                detail=f"No provide relationship found with the specified parameters"
             )
             
-            if not result:
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"No provide relationship found with the specified parameters"
-                )
-                
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Provide relationship deleted successfully"
-                }
-            )
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        return {
+            "status": "success",
+            "message": "Provide relationship deleted successfully"
+        }
 
-    async def _get_module_provides(
+    def _get_module_provides(
         self, 
         module_id: str, 
         as_provider: bool = True,
         resource_type: Optional[ProvideType] = None
     ):
         """Get all provide relationships for a module"""
-        try:
-            provides = self.service.get_module_provides(
-                module_id=module_id,
-                as_provider=as_provider,
-                resource_type=resource_type
-            )
-            
-            return [
-                ModuleProvideResponse(
-                    provider_id=p.provider_id,
-                    receiver_id=p.receiver_id,
-                    resource_type=p.resource_type.value,
-                    description=p.description,
-                    created_at=p.created_at.isoformat(),
-                    updated_at=p.updated_at.isoformat()
-                )
-                for p in provides
-            ]
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-
-    async def _get_modules_with_access_to(
+        provides = self.service.get_module_provides(
+            module_id=module_id,
+            as_provider=as_provider,
+            resource_type=resource_type
+        )
+        
+        # Plain dicts in the ModuleProvideResponse shape; returning the response
+        # directly skips a model per row and response_model re-validation
+        return ORJSONResponse([
+            {
+                "provider_id": p.provider_id,
+                "receiver_id": p.receiver_id,
+                "resource_type": p.resource_type.value,
+                "description": p.description,
+                "created_at": p.created_at.isoformat(),
+                "updated_at": p.updated_at.isoformat()
+            }
+            for p in provides
+        ])
+
+    def _get_modules_with_access_to(
         self,
         module_id: str,
         resource_type: ProvideType
     ):
         """Get all modules that have access to specified resources of a module"""
-        try:
-            modules = self.service.get_modules_with_access_to(
-                module_id=module_id,
-                resource_type=resource_type
+        modules = self.service.get_modules_with_access_to(
+            module_id=module_id,
+            resource_type=resource_type
+        )
+        
+        return ORJSONResponse([_module_dict(
+            ModuleMetadata(
+                module_id=m.module_id,
+                module_name=m.module_name,
+                project_id=m.project_mappings[0].project_id if m.project_mappings else "",
+                kit_id=m.kit_id,
+                owner=m.owner,
+                version=m.version,
+                created_at=m.created_at.isoformat(),
+                env_vars=m.env_vars,
+                workspace_name=m.workspace_name,
+                path=m.project_mappings[0].path if m.project_mappings else ""
             )
-            
-            return [ModuleResponse.from_metadata(
-                ModuleMetadata(
-                    module_id=m.module_id,
-                    module_name=m.module_name,
-                    project_id=m.project_mappings[0].project_id if m.project_mappings else "",
-                    kit_id=m.kit_id,
-                    owner=m.owner,
-                    version=m.version,
-                    created_at=m.created_at.isoformat(),
-                    env_vars=m.env_vars,
-                    workspace_name=m.workspace_name,
-                    path=m.project_mappings[0].path if m.project_mappings else ""
-                )
-            ) for m in modules]
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        ) for m in modules])
 
-    async def _get_modules_providing_to(
+    def _get_modules_providing_to(
         self,
         module_id: str,
         resource_type: ProvideType
     ):
         """Get all modules that provide specified resources to a module"""
-        try:
-            modules = self.service.get_modules_providing_to(
-                module_id=module_id,
-                resource_type=resource_type
+        modules = self.service.get_modules_providing_to(
+            module_id=module_id,
+            resource_type=resource_type
+        )
+        
+        return ORJSONResponse([_module_dict(
+            ModuleMetadata(
+                module_id=m.module_id,
+                module_name=m.module_name,
+                project_id=m.project_mappings[0].project_id if m.project_mappings else "",
+                kit_id=m.kit_id,
+                owner=m.owner,
+                version=m.version,
+                created_at=m.created_at.isoformat(),
+                env_vars=m.env_vars,
+                workspace_name=m.workspace_name,
+                path=m.project_mappings[0].path if m.project_mappings else ""
             )
-            
-            return [ModuleResponse.from_metadata(
-                ModuleMetadata(
-                    module_id=m.module_id,
-                    module_name=m.module_name,
-                    project_id=m.project_mappings[0].project_id if m.project_mappings else "",
-                    kit_id=m.kit_id,
-                    owner=m.owner,
-                    version=m.version,
-                    created_at=m.created_at.isoformat(),
-                    env_vars=m.env_vars,
-                    workspace_name=m.workspace_name,
-                    path=m.project_mappings[0].path if m.project_mappings else ""
-                )
-            ) for m in modules]
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        ) for m in modules])
 
-    async def _update_module_provide_description(
+    def _update_module_provide_description(
         self,
         provider_id: str,
         receiver_id: str,
@@ -529,53 +517,47 @@ class ModuleRouter:
         request: UpdateProvideDescriptionRequest
     ):
         """Update the description of a provide relationship"""
-        try:
-            result = self.service.update_module_provide_description(
-                provider_id=provider_id,
-                receiver_id=receiver_id,
-                resource_type=resource_type,
-                description=request.description
+        result = self.service.update_module_provide_description(
+            provider_id=provider_id,
+            receiver_id=receiver_id,
+            resource_type=resource_type,
+            description=request.description
+        )
+        
+        if not result:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No provide relationship found with the specified parameters"
             )
             
-            if not result:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No provide relationship found with the specified parameters"
-                )
-                
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": "Provide relationship description updated successfully"
-                }
-            )
-        except ModuleError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        
+        return {
+            "status": "success",
+            "message": "Provide relationship description updated successfully"
+        }
 
 
 
 
 
-    async def get_providing(self, module_id: str):
+    def get_providing(self, module_id: str):
         """Get resources that this module provides to other modules"""
-        return (await self._get_module_provides(module_id, as_provider=True))
+        return (self._get_module_provides(module_id, as_provider=True))
         
-    async def get_receiving(self, module_id: str):
+    def get_receiving(self, module_id: str):
         """Get resources that this module receives from other modules"""
-        return (await self._get_module_provides(module_id, as_provider=False))
+        return (self._get_module_provides(module_id, as_provider=False))
         
-    async def get_providing_by_type(self, module_id: str, resource_type: ProvideType):
+    def get_providing_by_type(self, module_id: str, resource_type: ProvideType):
         """Get specific resources that this module provides to other modules"""
-        return (await self._get_module_provides(
+        return (self._get_module_provides(
             module_id, 
             as_provider=True,
             resource_type=resource_type
         ))
         
-    async def get_receiving_by_type(self, module_id: str, resource_type: ProvideType):
+    def get_receiving_by_type(self, module_id: str, resource_type: ProvideType):
         """Get specific resources that this module receives from other modules"""
-        return (await self._get_module_provides(
+        return (self._get_module_provides(
             module_id, 
             as_provider=False,
             resource_type=resource_type
@@ -1,10 +1,12 @@
 from pathlib import Path
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from engine.auth.dependencies import ACT_LIST, ACT_READ, OBJ_RESOURCE, require_action
+from engine.apis.errors import error_route_class
 from engine.services.storage.resource import Resource, ResourceError, ResourceService
 from engine.db.session import get_db
 
@@ -19,6 +21,34 @@ class WorkspaceFileMetadata(BaseModel):
     last_modified: str # ISO format timestamp
 
 
+def _unexpected_error(exc: Exception) -> HTTPException:
+    return HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(exc)}")
+
+
+def _paths_error(exc: ResourceError) -> HTTPException:
+    # Use 404 if it's a "not found" type error, 400 otherwise
+    status_code = 404 if "not found" in str(exc).lower() else 400
+    return HTTPException(status_code=status_code, detail=str(exc))
+
+
+def _file_error(exc: ResourceError) -> HTTPException:
+    # A path outside the workspace is reported like a missing file
+    message = str(exc)
+    status_code = 404 if "not found" in message.lower() or "Access denied" in message else 400
+    return HTTPException(status_code=status_code, detail=message)
+
+
+# The workspace listing and file routes also turn unexpected errors into a 500
+# that carries the error message
+_ResourceErrorRoute = error_route_class(
+    {ResourceError: 400},
+    overrides={
+        "_list_workspace_paths": {ResourceError: _paths_error, Exception: _unexpected_error},
+        "_get_workspace_file_content": {ResourceError: _file_error, Exception: _unexpected_error},
+    }
+)
+
+
 class ResourceRouter:
     """FastAPI router for resource endpoints"""
 
@@ -28,7 +58,12 @@ class ResourceRouter:
         prefix: str = "/resource"
     ):
         self.service = resource_service
-        self.router = APIRouter(prefix=prefix, tags=["resources"])
+        self.router = APIRouter(
+            prefix=prefix,
+            tags=["resources"],
+            default_response_class=ORJSONResponse,
+            route_class=_ResourceErrorRoute
+        )
         self._setup_routes()
 
 
@@ -42,78 +77,51 @@ class ResourceRouter:
 
 
 
-    async def _list_workspace_paths(self, module_id: str) -> List[WorkspaceFileMetadata]:
+    def _list_workspace_paths(self, module_id: str) -> List[WorkspaceFileMetadata]:
         """List all files in the module's workspace with metadata."""
-        try:
-            # The service now returns a list of dicts matching the model
-            paths_data = self.service.list_workspace_paths(module_id)
-            # Validate data with the Pydantic model
-            return [WorkspaceFileMetadata(**item) for item in paths_data]
-        except ResourceError as e:
-            # Use 404 if it's a "not found" type error, 400/500 otherwise
-            if "not found" in str(e).lower():
-                 raise HTTPException(status_code=404, detail=str(e))
-            else:
-                 raise HTTPException(status_code=400, detail=str(e))
-        except Exception as e:
-            # Catch unexpected errors
-            raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+        # The service builds dicts matching WorkspaceFileMetadata; return them as-is.
+        # A Response bypasses response_model, which is kept for the OpenAPI schema.
+        paths_data = self.service.list_workspace_paths(module_id)
+        return ORJSONResponse(paths_data)
 
 
     # --- NEW ENDPOINT: Get Workspace File Content ---
-    async def _get_workspace_file_content(
+    def _get_workspace_file_content(
         self,
         module_id: str,
         relative_path: str = Query(..., description="Relative path of the file within the workspace")
     ) -> Response:
         """Gets the content of a specific file, handling binary types."""
-        try:
-            content_bytes, mime_type = self.service.get_workspace_file(module_id, relative_path)
-
-            # Use a sensible default if MIME type detection fails
-            media_type = mime_type if mime_type else "application/octet-stream"
+        content_bytes, mime_type = self.service.get_workspace_file(module_id, relative_path)
 
-            # Extract filename for Content-Disposition
-            file_name = Path(relative_path).name
+        # Use a sensible default if MIME type detection fails
+        media_type = mime_type if mime_type else "application/octet-stream"
 
-            headers = {
-                # Suggest filename for download
-                "Content-Disposition": f'inline; filename="{file_name}"'
-                # Use 'attachment' instead of 'inline' to force download
-            }
+        # Extract filename for Content-Disposition
+        file_name = Path(relative_path).name
 
-            # Return raw bytes with appropriate headers
-            return Response(content=content_bytes, media_type=media_type, headers=headers)
+        headers = {
+            # Suggest filename for download
+            "Content-Disposition": f'inline; filename="{file_name}"'
+            # Use 'attachment' instead of 'inline' to force download
+        }
 
-        except ResourceError as e:
-            if "not found" in str(e).lower() or "Access denied" in str(e):
-                 raise HTTPException(status_code=404, detail=str(e))
-            elif "Path is not a file" in str(e):
-                 raise HTTPException(status_code=400, detail=str(e))
-            else:
-                 raise HTTPException(status_code=400, detail=str(e)) # Or 500 if it's an internal read error
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
+        # Return raw bytes with appropriate headers
+        return Response(content=content_bytes, media_type=media_type, headers=headers)
 
 
 
-    async def _get_workspace_resources(self, module_id: str) -> List[Resource]:
+    def _get_workspace_resources(self, module_id: str) -> List[Resource]:
         """Get workspace resources"""
-        try:
-            resources = self.service.get_workspace_resources(module_id)
-            return resources
-        except ResourceError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        resources = self.service.get_workspace_resources(module_id)
+        return ORJSONResponse([r.model_dump() for r in resources])
 
 
 
-    async def _get_provide_instruction_resources(self, module_id: str) -> List[Resource]:
+    def _get_provide_instruction_resources(self, module_id: str) -> List[Resource]:
         """Get specification resources"""
-        try:
-            resources = self.service.get_provided_instruction_resources(module_id)
-            return resources
-        except ResourceError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+        resources = self.service.get_provided_instruction_resources(module_id)
+        return ORJSONResponse([r.model_dump() for r in resources])
 
 
     def _setup_routes(self):
@@ -1,16 +1,17 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, File, Form, UploadFile
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from engine.auth.dependencies import ACT_CREATE, ACT_DELETE, ACT_LIST, ACT_READ, ACT_UPDATE, OBJ_WORKSPACE, require_action
+from engine.apis.errors import error_route_class
 from engine.services.storage.workspace import (
     CommitInfo,
+    WorkspaceError,
     WorkspaceExistsError,
     WorkspaceNotFoundError,
     WorkspaceService,
-    WorkspaceError,
 )
 from engine.utils.file import extract_zip, is_safe_path
 
@@ -42,6 +43,16 @@ class WorkspaceCreationResponse(BaseModel):
     created_at: str
     status: str
 
+# A missing workspace is a 404 for the routes that act on one; creating a
+# workspace that exists is a client error
+_WorkspaceErrorRoute = error_route_class(
+    {WorkspaceNotFoundError: 404, WorkspaceError: 500},
+    overrides={
+        "_create_workspace": {WorkspaceExistsError: 400, WorkspaceNotFoundError: 500},
+        "_list_workspaces": {WorkspaceNotFoundError: 500},
+    }
+)
+
 class WorkspaceRouter:
     """FastAPI router for workspace management endpoints"""
 
@@ -58,103 +69,75 @@ class WorkspaceRouter:
             prefix: URL prefix for routes
         """
         self.service = workspace_service
-        self.router = APIRouter(prefix=prefix, tags=["workspace"])
+        self.router = APIRouter(
+            prefix=prefix,
+            tags=["workspace"],
+            default_response_class=ORJSONResponse,
+            route_class=_WorkspaceErrorRoute
+        )
         self._setup_routes()
 
-    async def _create_workspace(
+    def _create_workspace(
         self,
         workspace_file: UploadFile = File(...),
         workspace_name: str = Form(...)
     ):
         """Handle workspace creation"""
-        try:
-            result = self.service.create_workspace(
-                workspace_name=workspace_name,
-                content_file=workspace_file.file,
-                filename=workspace_file.filename,
-                extract_func=extract_zip  # You'll need to import this
-            )
-            return WorkspaceCreationResponse(**result)
-
-        except WorkspaceExistsError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        except WorkspaceError as e:
-            raise HTTPException(status_code=500, detail=str(e))
-
-    async def _list_workspaces(self):
+        result = self.service.create_workspace(
+            workspace_name=workspace_name,
+            content_file=workspace_file.file,
+            filename=workspace_file.filename,
+            extract_func=extract_zip  # You'll need to import this
+        )
+        return WorkspaceCreationResponse(**result)
+
+    def _list_workspaces(self):
         """List all workspaces"""
-        try:
-            workspaces = self.service.list_workspaces()
-            return {"workspaces": workspaces}
-        except WorkspaceError as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        workspaces = self.service.list_workspaces()
+        return {"workspaces": workspaces}
 
-    async def _list_workspace_files(self, workspace_name: str):
+    def _list_workspace_files(self, workspace_name: str):
         """List workspace files"""
-        try:
-            files = self.service.list_files(workspace_name)
-            return {"files": files}
-        except WorkspaceNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-        except WorkspaceError as e:
-            raise HTTPException(status_code=500, detail=str(e))
-
-    async def _delete_workspace(self, workspace_name: str):
+        files = self.service.list_files(workspace_name)
+        return {"files": files}
+
+    def _delete_workspace(self, workspace_name: str):
         """Delete workspace"""
-        try:
-            self.service.delete_workspace(workspace_name)
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "message": f"Workspace {workspace_name} deleted successfully"
-                }
-            )
-        except WorkspaceNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-        except WorkspaceError as e:
-            raise HTTPException(status_code=500, detail=str(e))
-
-    async def _commit_changes(
+        self.service.delete_workspace(workspace_name)
+        return {
+            "status": "success",
+            "message": f"Workspace {workspace_name} deleted successfully"
+        }
+
+    def _commit_changes(
         self,
         workspace_name: str,
         commit_data: CommitRequest
     ):
         """Handle workspace commit"""
-        try:
-            commit_info = CommitInfo(
-                commit_message=commit_data.commit_message,
-                author_name=commit_data.author_name,
-                author_email=commit_data.author_email
-            )
-
-            result = self.service.commit_changes(workspace_name, commit_info)
-            return JSONResponse(content=result)
-
-        except WorkspaceNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-        except WorkspaceError as e:
-            raise HTTPException(status_code=500, detail=str(e))
-
-    async def _update_file(
+        commit_info = CommitInfo(
+            commit_message=commit_data.commit_message,
+            author_name=commit_data.author_name,
+            author_email=commit_data.author_email
+        )
+
+        result = self.service.commit_changes(workspace_name, commit_info)
+        return result
+
+    def _update_file(
         self,
         workspace_name: str,
         file_path: str,
         update: FileUpdateRequest
     ):
         """Handle file update"""
-        try:
-            result = self.service.update_file(
-                workspace_name=workspace_name,
-                file_path=file_path,
-                content=update.content,
-                path_validator=is_safe_path  # You'll need to import this
-            )
-            return JSONResponse(content=result)
-
-        except WorkspaceNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-        except WorkspaceError as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        result = self.service.update_file(
+            workspace_name=workspace_name,
+            file_path=file_path,
+            content=update.content,
+            path_validator=is_safe_path  # You'll need to import this
+        )
+        return result
 
     def _setup_routes(self):
         """Setup all routes with specific permissions."""
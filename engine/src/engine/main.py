@@ -1,9 +1,11 @@
 import asyncio
 import os
 import logging
+import re
 import threading
 import time
 import traceback
+import anyio.to_thread
 from pathlib import Path
 from typing import Any, Dict, List
 import secrets
@@ -17,7 +19,8 @@ from fastapi.responses import JSONResponse
 
 from loguru import logger
 from sqlalchemy import select
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 # Import routers
@@ -67,53 +70,130 @@ load_dotenv()
 # Basic auth configuration
 security = HTTPBasic()
 
-class LogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class LogMiddleware:
+    """
+    Log each request and its duration. Plain ASGI rather than
+    BaseHTTPMiddleware, so requests are not wrapped in an extra task and
+    response stream on the way through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        
+        method = scope["method"]
+        path = scope["path"]
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            logger.info(f"{request.method} {request.url.path}")
-            
-            # Try to log request body for debugging if needed
-            if request.method in ["POST", "PUT", "PATCH"]:
-                try:
-                    body = await request.body()
-                    if os.environ.get("DEV_MODE"):
-                        logger.debug(f"Request body: {body.decode()}")
-                except:
-                    pass
-                    
-            response = await call_next(request)
-            
+            logger.info(f"{method} {path}")
+
+            # Log request body for debugging; the buffered messages are replayed to the app
+            if method in ["POST", "PUT", "PATCH"] and os.environ.get("DEV_MODE"):
+                receive = await self._log_body(receive)
+
+            await self.app(scope, receive, send_wrapper)
+
             process_time = time.time() - start_time
-            logger.info(f"Completed {request.method} {request.url.path} in {process_time:.2f}s")
-            
-            return response
-            
+            logger.info(f"Completed {method} {path} in {process_time:.2f}s")
+
         except Exception as e:
             # Enhanced error logging
             logger.error(f"""
 REQUEST FAILED!
-URL: {request.url.path}
-Method: {request.method}
+URL: {path}
+Method: {method}
 Error: {str(e)}
 Stack Trace:
 {traceback.format_exc()}
             """)
-            
+
             # Return error response with stack trace in development
-            if os.getenv("DEBUG"):
-                return JSONResponse(
+            if os.getenv("DEBUG") and not response_started:
+                response = JSONResponse(
                     status_code=500,
                     content={
                         "error": str(e),
                         "stack_trace": traceback.format_exc().split('\n')
                     }
                 )
+                await response(scope, receive, send)
+                return
             raise
 
+    @staticmethod
+    async def _log_body(receive: Receive) -> Receive:
+        messages = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            messages.append(message)
+            more_body = message.get("more_body", False)
+        try:
+            body = b"".join(m.get("body", b"") for m in messages)
+            logger.debug(f"Request body: {body.decode()}")
+        except:
+            pass
+
+        async def replay():
+            if messages:
+                return messages.pop(0)
+            return await receive()
+        return replay
+
+
+# GET routes that return listings large enough to be worth compressing, matched
+# against the whole path. Raw file content (/resource/{id}/workspace/file) is
+# left alone: it is often binary or already compressed.
+_GZIP_LISTING_ROUTES = re.compile("|".join([
+    r"/module/project/[^/]+/list",
+    r"/module/graph",
+    r"/module/[^/]+/(providing|receiving)(/[^/]+)?",
+    r"/module/[^/]+/(with-access-to|providers)/[^/]+",
+    r"/workspace/list",
+    r"/workspace/[^/]+/files",
+    r"/resource/[^/]+/workspace(/paths)?",
+    r"/resource/[^/]+/provide-instructions",
+    r"/kit",
+    r"/kit/[^/]+/[^/]+/versions",
+    r"/kit/registry",
+    r"/kit/registry/versions/[^/]+/[^/]+",
+]))
 
 
+class ListingGZipMiddleware:
+    """
+    Gzip GET responses from the listing routes. Plain ASGI rather than
+    BaseHTTPMiddleware; everything else, including file content, the chat
+    SSE streams and the LLM gateway, goes straight to the app.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 2048):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            path = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):]
+            if _GZIP_LISTING_ROUTES.fullmatch(path):
+                await self.gzip_app(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
 
 
 
@@ -130,6 +210,9 @@ app = FastAPI(
     root_path="/api/v1"  
 )
 app.add_middleware(LogMiddleware)
+app.add_middleware(ListingGZipMiddleware, minimum_size=2048)
+
+
 
 
 
@@ -452,6 +535,10 @@ def start_rpyc_server():
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on startup and run migrations"""
+    # Sync route handlers run in anyio's worker threads; the default limit of 40
+    # would cap concurrent blocking requests (git, zip, DB work) too low
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(os.getenv("THREADPOOL_SIZE", "200"))
+
     try:
         global rpyc_server_thread
         logger.info("Running database migrations...")
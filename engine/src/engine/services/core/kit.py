@@ -290,6 +290,9 @@ class VersionSort(Enum):
 
 
 
+SEMVER_PATTERN = re.compile(r'^\d+\.\d+\.\d+$')
+
+
 class KitService:
     """Core kit management service"""
 
@@ -314,8 +317,7 @@ class KitService:
         Returns:
             bool: True if valid semantic version
         """
-        pattern = r'^\d+\.\d+\.\d+$'
-        return bool(re.match(pattern, version))
+        return bool(SEMVER_PATTERN.match(version))
 
     def get_kit_path(self, owner: str, kit_id: str, version: Optional[str] = None) -> Path:
         """
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime, UTC
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy import and_, case, delete, or_, select, update
 from engine.db.models import Module, ModuleProvide, ProjectModuleMapping, ProvideType
 from engine.db.session import SessionLocal
@@ -212,17 +212,36 @@ class ModuleService:
 
     def get_project_modules(self, project_id: str) -> List[ModuleMetadata]:
         """Get all modules for a project"""
+        return [ModuleMetadata(**row) for row in self.get_project_modules_raw(project_id)]
+
+    def get_project_modules_raw(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all modules for a project as plain dicts keyed like ModuleMetadata
+
+        Selects the columns directly, so no ORM objects are built; list
+        endpoints serialize the rows as they are.
+        """
         try:
             with self._get_db() as db:
                 stmt = (
-                    select(Module, ProjectModuleMapping)
+                    select(
+                        Module.module_id,
+                        Module.module_name,
+                        ProjectModuleMapping.project_id,
+                        Module.kit_id,
+                        Module.owner,
+                        Module.version,
+                        Module.created_at,
+                        Module.env_vars,
+                        Module.workspace_name,
+                        ProjectModuleMapping.path
+                    )
                     .join(ProjectModuleMapping)
                     .where(ProjectModuleMapping.project_id == project_id)
                 )
-                results = db.execute(stmt).all()
                 return [
-                    ModuleMetadata.from_orm(module, mapping)
-                    for module, mapping in results
+                    {**row, "created_at": row["created_at"].isoformat()}
+                    for row in db.execute(stmt).mappings()
                 ]
 
         except Exception as e:
@@ -429,58 +448,6 @@ class ModuleService:
             raise ModuleError(f"Failed to get kit config: {str(e)}")
 
 
-
-
-    def create_module_provide(
-        self, 
-        provider_id: str, 
-        receiver_id: str, 
-        resource_type: ProvideType,
-        description: Optional[str] = None
-    ) -> ModuleProvide:
-        """
-        Create a new provide relationship between modules
-        
-        Args:
-            provider_id: ID of module providing the resource
-            receiver_id: ID of module receiving the resource
-            resource_type: Type of resource being provided (TOOL or WORKSPACE)
-            description: Optional description of the provide relationship
-            
-        Returns:
-            The created ModuleProvide instance
-            
-        Raises:
-            ValueError: If either module does not exist
-        """
-        # Validate that both modules exist
-        db = self._get_db()
-        provider = db.get(Module, provider_id)
-        receiver = db.get(Module, receiver_id)
-        
-        if not provider:
-            raise ValueError(f"Provider module with ID {provider_id} not found")
-        if not receiver:
-            raise ValueError(f"Receiver module with ID {receiver_id} not found")
-        
-        # Create the provide relationship
-        now = datetime.now(UTC)
-        provide = ModuleProvide(
-            provider_id=provider_id,
-            receiver_id=receiver_id,
-            resource_type=resource_type,
-            description=description,
-            created_at=now,
-            updated_at=now
-        )
-        
-        db.add(provide)
-        db.commit()
-        db.refresh(provide)
-        
-        return provide
-
-
     def get_module_provides(
         self, 
         module_id: str, 
@@ -513,36 +480,6 @@ class ModuleService:
         return list(result.scalars().all())
 
 
-    def delete_module_provide(
-        self, 
-        provider_id: str, 
-        receiver_id: str, 
-        resource_type: ProvideType
-    ) -> bool:
-        """
-        Delete a provide relationship between modules
-        
-        Args:
-            provider_id: ID of provider module
-            receiver_id: ID of receiver module
-            resource_type: Type of resource
-            
-        Returns:
-            True if relationship was deleted, False if it didn't exist
-        """
-        db = self._get_db()
-        query = delete(ModuleProvide).where(
-            ModuleProvide.provider_id == provider_id,
-            ModuleProvide.receiver_id == receiver_id,
-            ModuleProvide.resource_type == resource_type
-        )
-        
-        result = db.execute(query)
-        db.commit()
-        
-        return result.rowcount > 0
-
-
     def get_modules_with_access_to(
         self, 
         module_id: str, 
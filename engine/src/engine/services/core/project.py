@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, UTC
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
@@ -36,8 +36,13 @@ class ProjectError(Exception):
 class ProjectService:
     """Service for managing projects"""
 
-    def __init__(self):
-        """Initialize project service"""
+    def __init__(self, id_factory: Callable[[], uuid.UUID] = uuid.uuid4):
+        """Initialize project service
+
+        Args:
+            id_factory: Callable producing new project IDs; defaults to uuid.uuid4
+        """
+        self._id_factory = id_factory
         self._ensure_default_project()
 
     def _get_db(self) -> Session:
@@ -67,7 +72,7 @@ class ProjectService:
     def create_project(self, name: str) -> ProjectMetadata:
         """Create new project"""
         try:
-            project_id = str(uuid.uuid4())
+            project_id = str(self._id_factory())
             
             with self._get_db() as db:
                 project = Project(
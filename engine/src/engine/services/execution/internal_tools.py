@@ -1,7 +1,9 @@
+import copy
+import functools
 import inspect
 import re
 from typing import Any, Callable, Dict, List, Literal, Optional, Union, get_type_hints
-from engine.services.execution.tool import FunctionMetadata
+from engine.services.execution.function_parser import FunctionMetadata
 from loguru import logger
 
 class InternalToolManager:
@@ -284,7 +286,8 @@ class InternalToolManager:
             param_description = self._extract_param_description(func, param_name)
             logger.debug(f"Parameter description: {param_description}")
             
-            # Create parameter property
+            # Create parameter property. json_type may be a shared cached
+            # schema, so nested parts are copied into the tool's parameters
             param_property = {}
             
             # Handle complex schema types (oneOf, enum, etc.)
@@ -292,22 +295,22 @@ class InternalToolManager:
                 param_property["type"] = json_type["type"]
             
             if "oneOf" in json_type:
-                param_property["oneOf"] = json_type["oneOf"]
+                param_property["oneOf"] = copy.deepcopy(json_type["oneOf"])
             
             if "enum" in json_type:
-                param_property["enum"] = json_type["enum"]
+                param_property["enum"] = list(json_type["enum"])
             
             # Add description
             param_property["description"] = param_description or f"Parameter {param_name}"
             
             # If array or object, add items/properties
             if "items" in json_type:
-                param_property["items"] = json_type["items"]
+                param_property["items"] = copy.deepcopy(json_type["items"])
                 
             if "properties" in json_type:
-                param_property["properties"] = json_type["properties"]
+                param_property["properties"] = copy.deepcopy(json_type["properties"])
                 if "required" in json_type:
-                    param_property["required"] = json_type["required"]
+                    param_property["required"] = list(json_type["required"])
             
             # Add to properties dictionary
             parameters["properties"][param_name] = param_property
@@ -375,80 +378,98 @@ class InternalToolManager:
             type_hint: Python type hint
             
         Returns:
-            Dict with JSON schema type information
+            Dict with JSON schema type information. The dict may be a cached
+            schema shared with other callers; copy it before changing it.
         """
         logger.debug(f"Converting type hint to JSON schema: {type_hint}")
-        
-        # Handle common types
-        if type_hint is str:
-            return {"type": "string"}
-        elif type_hint is int:
-            return {"type": "integer"}
-        elif type_hint is float:
-            return {"type": "number"}
-        elif type_hint is bool:
-            return {"type": "boolean"}
-        elif type_hint is None or type_hint is type(None):
-            return {"type": "null"}
-        elif hasattr(type_hint, "__origin__"):
-            # Handle generics like List, Dict, etc.
-            origin = type_hint.__origin__
-            args = type_hint.__args__
-            logger.debug(f"Generic type with origin {origin} and args {args}")
-            
-            if origin is list or origin is List:
-                item_type = self._type_to_json_schema(args[0])
-                return {
-                    "type": "array",
-                    "items": item_type
-                }
-            elif origin is dict or origin is Dict:
-                # For simplicity, assume dict keys are strings
-                value_type = self._type_to_json_schema(args[1])
-                return {
-                    "type": "object",
-                    "additionalProperties": value_type
-                }
-            elif origin is Union or origin is Optional:
-                # Handle Optional/Union
-                if type(None) in args:
-                    # This is Optional[X]
-                    non_none_args = [arg for arg in args if arg is not type(None)]
-                    if len(non_none_args) == 1:
-                        result = self._type_to_json_schema(non_none_args[0])
-                        return result
-                # For regular unions, return a oneOf schema
-                types = [self._type_to_json_schema(arg) for arg in args if arg is not type(None)]
-                if len(types) > 1:
-                    return {"oneOf": types}
-                elif len(types) == 1:
-                    return types[0]
-                return {"type": "object"}
-            elif origin is Literal:
-                # Handle Literal type (enum)
-                return {
-                    "type": "string",
-                    "enum": list(args)
-                }
-        elif hasattr(type_hint, "__name__") and type_hint.__name__ == "Enum":
-            # Handle Enum classes
-            try:
-                return {
-                    "type": "string",
-                    "enum": [e.name for e in type_hint]
-                }
-            except:
-                return {"type": "string"}
-                
-        # Try to handle Pydantic models if available
+        return _schema_for(type_hint)
+
+
+def _schema_for(type_hint: Any) -> Dict[str, Any]:
+    """JSON schema for a type hint, memoized when the hint is hashable."""
+    try:
+        return _cached_type_schema(type_hint)
+    except TypeError:
+        # Unhashable hints (e.g. Annotated with list metadata) skip the cache
+        return _build_type_schema(type_hint)
+
+@functools.lru_cache(maxsize=1024)
+def _cached_type_schema(type_hint: Any) -> Dict[str, Any]:
+    return _build_type_schema(type_hint)
+
+def _build_type_schema(type_hint: Any) -> Dict[str, Any]:
+    """Convert a Python type hint to a JSON schema; nested hints go through _schema_for."""
+
+    # Handle common types
+    if type_hint is str:
+        return {"type": "string"}
+    elif type_hint is int:
+        return {"type": "integer"}
+    elif type_hint is float:
+        return {"type": "number"}
+    elif type_hint is bool:
+        return {"type": "boolean"}
+    elif type_hint is None or type_hint is type(None):
+        return {"type": "null"}
+    elif hasattr(type_hint, "__origin__"):
+        # Handle generics like List, Dict, etc.
+        origin = type_hint.__origin__
+        args = type_hint.__args__
+        logger.debug(f"Generic type with origin {origin} and args {args}")
+
+        if origin is list or origin is List:
+            item_type = _schema_for(args[0])
+            return {
+                "type": "array",
+                "items": item_type
+            }
+        elif origin is dict or origin is Dict:
+            # For simplicity, assume dict keys are strings
+            value_type = _schema_for(args[1])
+            return {
+                "type": "object",
+                "additionalProperties": value_type
+            }
+        elif origin is Union or origin is Optional:
+            # Handle Optional/Union
+            if type(None) in args:
+                # This is Optional[X]
+                non_none_args = [arg for arg in args if arg is not type(None)]
+                if len(non_none_args) == 1:
+                    result = _schema_for(non_none_args[0])
+                    return result
+            # For regular unions, return a oneOf schema
+            types = [_schema_for(arg) for arg in args if arg is not type(None)]
+            if len(types) > 1:
+                return {"oneOf": types}
+            elif len(types) == 1:
+                return types[0]
+            return {"type": "object"}
+        elif origin is Literal:
+            # Handle Literal type (enum)
+            return {
+                "type": "string",
+                "enum": list(args)
+            }
+    elif hasattr(type_hint, "__name__") and type_hint.__name__ == "Enum":
+        # Handle Enum classes
         try:
-            if hasattr(type_hint, "model_json_schema"):
-                schema = type_hint.model_json_schema()
-                logger.debug(f"Got schema from Pydantic model: {schema}")
-                return schema
-        except Exception as e:
-            logger.warning(f"Error getting Pydantic schema: {str(e)}")
-            
-        # Default for unknown/complex types
-        logger.debug(f"Using default object schema for type: {type_hint}")
-        return {"type": "object"}
\ No newline at end of file
+            return {
+                "type": "string",
+                "enum": [e.name for e in type_hint]
+            }
+        except:
+            return {"type": "string"}
+
+    # Try to handle Pydantic models if available
+    try:
+        if hasattr(type_hint, "model_json_schema"):
+            schema = type_hint.model_json_schema()
+            logger.debug(f"Got schema from Pydantic model: {schema}")
+            return schema
+    except Exception as e:
+        logger.warning(f"Error getting Pydantic schema: {str(e)}")
+
+    # Default for unknown/complex types
+    logger.debug(f"Using default object schema for type: {type_hint}")
+    return {"type": "object"}
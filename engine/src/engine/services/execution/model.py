@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Union, TypeVar, Type, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Union, TypeVar, Type, Tuple
+import functools
 import os
 from pydantic import BaseModel
 
@@ -99,6 +100,20 @@ MODEL_CONFIG_KEY = "model_name"
 ResponseType = TypeVar('ResponseType', bound=BaseModel)
 
 
+@functools.lru_cache(maxsize=None)
+def _available_models_for(providers: FrozenSet[str]) -> Tuple[Tuple[str, List[Dict[str, str]]], ...]:
+    """
+    (provider, models) pairs for a set of configured providers. The result is
+    shared between callers and the models are MODEL_CONFIGS' own lists, so
+    callers must copy before handing them out.
+    """
+    return tuple(
+        (provider, config["models"])
+        for provider, config in MODEL_CONFIGS.items()
+        if provider in providers
+    )
+
+
 class ModelService:
     """Simple service for managing LLM interactions with database persistence"""
 
@@ -113,13 +128,15 @@ class ModelService:
         Returns:
             Dictionary of provider: list of available models
         """
-        available_models = {}
-        
-        for provider, config in MODEL_CONFIGS.items():
-            if os.environ.get(config["env_var"]):
-                available_models[provider] = config["models"]
-                
-        return available_models
+        configured = frozenset(
+            provider
+            for provider, config in MODEL_CONFIGS.items()
+            if os.environ.get(config["env_var"])
+        )
+        return {
+            provider: [dict(model) for model in models]
+            for provider, models in _available_models_for(configured)
+        }
 
     def __init__(self):
         """Initialize the model service with persisted configuration if available"""
@@ -3,11 +3,17 @@ from enum import Enum
 from typing import Any, Dict
 
 from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from engine.db.models import AgentStatus, ProfileStatus
 from engine.db.session import SessionLocal
 
+# Dialects with INSERT ... ON CONFLICT support; others fall back to Session.merge
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 
 
@@ -26,13 +32,22 @@ class StateService:
 
     def initialize_module(self, module_id: str):
         """Set up initial state for new module"""
+        values = {
+            "module_id": module_id,
+            "state": AgentState.STANDBY.value,
+            "last_updated": datetime.now(UTC)
+        }
         with self._get_db() as db:
-            status = AgentStatus(
-                module_id=module_id,
-                state=AgentState.STANDBY.value,
-                last_updated=datetime.now(UTC)
-            )
-            db.merge(status)  # merge instead of add to handle both insert and update
+            insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+            if insert is None:
+                db.merge(AgentStatus(**values))  # merge instead of add to handle both insert and update
+            else:
+                # Single-statement upsert instead of merge's SELECT + INSERT/UPDATE
+                stmt = insert(AgentStatus).values(**values)
+                db.execute(stmt.on_conflict_do_update(
+                    index_elements=[AgentStatus.module_id],
+                    set_={"state": stmt.excluded.state, "last_updated": stmt.excluded.last_updated}
+                ))
             db.commit()
 
     def get_status(self, module_id: str) -> tuple[Any, AgentState]:
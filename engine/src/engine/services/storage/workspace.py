@@ -10,6 +10,10 @@ from git.repo import Repo
 from loguru import logger
 
 
+# Copy uploads to disk in 1 MiB chunks rather than shutil's 64 KiB default
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
 @dataclass
 class CommitInfo:
     commit_message: str
@@ -119,7 +123,7 @@ class WorkspaceService:
 
             # Save uploaded file
             with temp_file.open("wb") as buffer:
-                shutil.copyfileobj(content_file, buffer)
+                shutil.copyfileobj(content_file, buffer, _COPY_CHUNK_SIZE)
 
             # Extract if zip file
             if filename.endswith('.zip'):
@@ -0,0 +1,145 @@
+# tests/apis/test_errors.py
+
+import sys
+import types
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from engine.services.core.module import ModuleError
+from engine.services.storage.resource import ResourceError
+from engine.services.storage.workspace import (
+    WorkspaceError,
+    WorkspaceExistsError,
+    WorkspaceNotFoundError,
+)
+
+# --- Constants ---
+MODULE_ID = "mod-abc"
+WORKSPACE_NAME = "test-workspace"
+CREATE_MODULE_BODY = {
+    "project_id": "prj-test-123",
+    "owner": "test-owner",
+    "kit_id": "test-kit",
+    "version": "1.0.0",
+    "env_vars": {},
+    "path": "test.module"
+}
+CREATE_PROVIDE_BODY = {"provider_id": "mod-a", "receiver_id": "mod-b", "resource_type": "workspace"}
+
+# --- Fixtures ---
+
+class _AuthStub(types.ModuleType):
+    """engine.auth.dependencies loads casbin policies from the DB on import; the
+    routers only need its OBJ_*/ACT_* names and require_action."""
+
+    def __getattr__(self, name: str):
+        if name == "require_action":
+            return lambda obj, act: []
+        return name
+
+@pytest.fixture(scope="module")
+def services():
+    """Routers under test, mounted on a bare app over Mock services."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "engine.auth.dependencies", _AuthStub("engine.auth.dependencies"))
+        from engine.apis.module import ModuleRouter
+        from engine.apis.resource import ResourceRouter
+        from engine.apis.workspace import WorkspaceRouter
+
+        services = SimpleNamespace(module=Mock(), workspace=Mock(), resource=Mock())
+        app = FastAPI()
+        app.include_router(ModuleRouter(module_service=services.module).router)
+        app.include_router(WorkspaceRouter(workspace_service=services.workspace).router)
+        app.include_router(ResourceRouter(resource_service=services.resource).router)
+        services.client = TestClient(app, raise_server_exceptions=False)
+        yield services
+
+@pytest.fixture
+def client(services: SimpleNamespace) -> TestClient:
+    for service in (services.module, services.workspace, services.resource):
+        service.reset_mock(return_value=True, side_effect=True)
+    return services.client
+
+def _fail(services: SimpleNamespace, service_method: str, exc: Exception):
+    service_name, method = service_method.split(".")
+    getattr(getattr(services, service_name), method).side_effect = exc
+
+# --- Test Cases ---
+
+class TestRouterErrorMapping:
+
+    @pytest.mark.parametrize("method, url, service_method, exc, expected_status", [
+        # Module router: ModuleError is a 400, except for delete and graph
+        ("POST", "/module/", "module.create_module", ModuleError("boom"), 400),
+        ("DELETE", f"/module/{MODULE_ID}", "module.delete_module", ModuleError("boom"), 500),
+        ("GET", "/module/graph", "module.get_module_graph", ModuleError("boom"), 500),
+        ("GET", "/module/project/prj-test-123/list", "module.get_project_modules_raw", ModuleError("boom"), 400),
+        ("GET", f"/module/{MODULE_ID}/providing", "module.get_module_provides", ModuleError("boom"), 400),
+        ("POST", "/module/provide", "module.create_module_provide", ModuleError("boom"), 400),
+        ("POST", "/module/provide", "module.create_module_provide", ValueError("boom"), 400),
+        # Workspace router
+        ("GET", "/workspace/list", "workspace.list_workspaces", WorkspaceError("boom"), 500),
+        ("GET", "/workspace/list", "workspace.list_workspaces", WorkspaceNotFoundError("boom"), 500),
+        ("GET", f"/workspace/{WORKSPACE_NAME}/files", "workspace.list_files", WorkspaceNotFoundError("boom"), 404),
+        ("GET", f"/workspace/{WORKSPACE_NAME}/files", "workspace.list_files", WorkspaceError("boom"), 500),
+        ("DELETE", f"/workspace/{WORKSPACE_NAME}", "workspace.delete_workspace", WorkspaceNotFoundError("boom"), 404),
+        ("DELETE", f"/workspace/{WORKSPACE_NAME}", "workspace.delete_workspace", WorkspaceExistsError("boom"), 500),
+        # Resource router
+        ("GET", f"/resource/{MODULE_ID}/workspace/paths", "resource.list_workspace_paths", ResourceError("Module not found"), 404),
+        ("GET", f"/resource/{MODULE_ID}/workspace/paths", "resource.list_workspace_paths", ResourceError("Access denied"), 400),
+        ("GET", f"/resource/{MODULE_ID}/workspace/file?relative_path=a.txt", "resource.get_workspace_file", ResourceError("File not found"), 404),
+        ("GET", f"/resource/{MODULE_ID}/workspace/file?relative_path=a.txt", "resource.get_workspace_file", ResourceError("Access denied"), 404),
+        ("GET", f"/resource/{MODULE_ID}/workspace/file?relative_path=a.txt", "resource.get_workspace_file", ResourceError("Path is not a file"), 400),
+        ("GET", f"/resource/{MODULE_ID}/workspace", "resource.get_workspace_resources", ResourceError("Module not found"), 400),
+        ("GET", f"/resource/{MODULE_ID}/provide-instructions", "resource.get_provided_instruction_resources", ResourceError("Module not found"), 400),
+    ])
+    def test_service_error_status(self, services, client, method, url, service_method, exc, expected_status):
+        _fail(services, service_method, exc)
+        body = {"/module/": CREATE_MODULE_BODY, "/module/provide": CREATE_PROVIDE_BODY}.get(url)
+
+        response = client.request(method, url, json=body)
+
+        assert response.status_code == expected_status
+        assert response.json() == {"detail": str(exc)}
+
+    def test_create_workspace_exists(self, services, client):
+        _fail(services, "workspace.create_workspace", WorkspaceExistsError("exists"))
+
+        response = client.post(
+            "/workspace/create",
+            files={"workspace_file": ("ws.zip", b"zip", "application/zip")},
+            data={"workspace_name": WORKSPACE_NAME}
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "exists"}
+
+    @pytest.mark.parametrize("url, service_method", [
+        (f"/resource/{MODULE_ID}/workspace/paths", "resource.list_workspace_paths"),
+        (f"/resource/{MODULE_ID}/workspace/file?relative_path=a.txt", "resource.get_workspace_file"),
+    ])
+    def test_unexpected_resource_error_keeps_detail(self, services, client, url, service_method):
+        _fail(services, service_method, RuntimeError("disk on fire"))
+
+        response = client.get(url)
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "An unexpected error occurred: disk on fire"}
+
+    def test_unmapped_error_is_not_swallowed(self, services, client):
+        _fail(services, "module.get_project_modules_raw", RuntimeError("disk on fire"))
+
+        response = client.get("/module/project/prj-test-123/list")
+
+        assert response.status_code == 500
+        assert response.text == "Internal Server Error"
+
+    def test_validation_errors_pass_through(self, client):
+        # relative_path is required; the mapped Exception fallback must not catch it
+        response = client.get(f"/resource/{MODULE_ID}/workspace/file")
+
+        assert response.status_code == 422
@@ -4,17 +4,26 @@ from unittest.mock import Mock, MagicMock, patch
 from contextlib import contextmanager
 
 # SQLAlchemy testing imports
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine, Connection
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import Session, configure_mappers
 from sqlalchemy.pool import StaticPool
 
 # Import your Base
 from engine.db.models import Base
 
+# Configure every mapper up front instead of on the first model instantiation
+configure_mappers()
+
 # Enable PDM pytest plugins
 pytest_plugins = ["pdm.pytest"]
 
+# Test files with module-scoped fixtures set `pytestmark = pytest.mark.xdist_group(...)`.
+# Under `pdm run test-parallel` (`--dist loadgroup`) all tests in a group run on one
+# worker, so those fixtures (and any DB rows they seed) are built once, not once per
+# worker. Files that share a name, like the DB-backed core services in "db_core",
+# share that worker.
+
 # --- Mock Fixtures ---
 
 @pytest.fixture
@@ -34,28 +43,50 @@ def engine_project(project):
 
 # --- Database Fixtures ---
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def engine() -> Engine:
-    """Generate the Engine. Use an in-memory DB."""
+    """
+    Generate the Engine. One in-memory pysqlite DB is shared by the whole
+    session; StaticPool hands every checkout the same connection. Under
+    pytest-xdist each worker process gets its own private DB this way.
+    """
     engine = create_engine(
-        'sqlite:///:memory:',
+        'sqlite+pysqlite:///:memory:',
         connect_args={"check_same_thread": False},
         poolclass=StaticPool
     )
     
+    # pysqlite emits its own BEGIN lazily, which lets a SAVEPOINT open (and its
+    # RELEASE commit) a transaction of its own. Take over transaction control so
+    # the SAVEPOINTs used by db_session nest inside the outer transaction.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    # Test data is throwaway: never wait on fsync or a journal file, and keep
+    # temp b-trees (sorts, GROUP BY) in RAM, even if the URL above is ever
+    # pointed at a file. WAL and mmap_size do not apply to :memory: DBs.
+    @event.listens_for(engine, "connect")
+    def _set_fast_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create all tables from the models
     Base.metadata.create_all(engine)
     
-    # Print the tables for debugging
-    inspector = inspect(engine)
-    print(f"Tables created: {inspector.get_table_names()}")
-    
     yield engine
     
-    # Clean up
-    Base.metadata.drop_all(engine)
+    # The in-memory DB goes away with its connection; no drop_all needed
+    engine.dispose()
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def connection(engine: Engine):
     """Generate a connection to the DB."""
     connection = engine.connect()
@@ -64,9 +95,14 @@ def connection(engine: Engine):
 
 @pytest.fixture
 def db_session(connection: Connection):
-    """For every test generate a new session with transaction rollback."""
-    transaction = connection.begin()
-    session = sessionmaker(bind=connection)()
+    """
+    For every test generate a new session inside an outer transaction.
+    Commits made by the code under test only release a SAVEPOINT, so rolling
+    back the outer transaction on teardown leaves the schema clean.
+    """
+    # Nest inside the module_db_session transaction when one is open
+    transaction = connection.begin_nested() if connection.in_transaction() else connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     
     try:
         yield session
@@ -74,18 +110,49 @@ def db_session(connection: Connection):
         session.close()
         transaction.rollback()
 
+@pytest.fixture(scope='module')
+def module_db_session(connection: Connection):
+    """
+    Long-lived session for seeding rows once per test module, shared by every
+    test in it. Tests that update or delete seeded rows do so through
+    db_session, whose SAVEPOINT nests inside this transaction and rolls their
+    changes back. Everything seeded here is rolled back once the module finishes.
+    """
+    transaction = connection.begin()
+    session = Session(bind=connection)
+
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+
+@contextmanager
+def _session_context(session: Session, rollback_on_error: bool):
+    try:
+        yield session
+    except Exception:
+        if rollback_on_error:
+            session.rollback()
+        raise
+
+@pytest.fixture(scope='session')
+def make_db_context():
+    """
+    Factory for stand-ins of a service's _get_db that hand out a test session:
+    `service._get_db = make_db_context(session)`. Use it for services bound to
+    a module-scoped session; per-test services take mock_db_context.
+    """
+    def make(session: Session, rollback_on_error: bool = False):
+        return lambda: _session_context(session, rollback_on_error)
+
+    return make
+
 @pytest.fixture
-def mock_db_context(db_session):
+def mock_db_context(db_session, make_db_context):
     """
     Creates a real context manager that yields the db_session.
     This fixes the 'function does not support context manager protocol' error.
+    Stands in for a service's _get_db: `service._get_db = mock_db_context`.
     """
-    @contextmanager
-    def session_context_manager():
-        try:
-            yield db_session
-        except Exception:
-            db_session.rollback()
-            raise
-    
-    return session_context_manager
\ No newline at end of file
+    return make_db_context(db_session, rollback_on_error=True)
@@ -0,0 +1,385 @@
+# tests/services/core/test_kit.py
+
+import pytest
+from pathlib import Path
+from typing import Union
+import io
+import itertools
+import os
+import shutil
+import tarfile
+
+import httpx
+import yaml
+
+from engine.services.core.kit import (
+    KitService,
+    KitConfig,
+    KitMetadata,
+    KitError,
+    KitNotFoundError,
+    VersionExistsError,
+    InvalidVersionError,
+    RegistryError,
+    VersionSort,
+)
+
+# --- Constants ---
+TEST_OWNER = "test_owner"
+TEST_KIT_ID = "test-kit"
+VALID_VERSION = "1.0.0"
+VALID_VERSION_2 = "1.1.0"
+REGISTRY_URL = "http://registry.test"
+
+SAMPLE_KIT_CONFIG = {
+    "docVersion": "v1",
+    "id": TEST_KIT_ID,
+    "version": VALID_VERSION,
+    "name": "Test Kit",
+    "owner": TEST_OWNER,
+    "environment": [
+        {"name": "API_KEY", "description": "API key for the kit", "required": True}
+    ],
+    "agents": [
+        {"name": "tasker", "class": "TaskerAgent", "description": "Default agent"}
+    ],
+    "provide": {
+        "instructions": [
+            {"name": "shared", "path": "shared_docs.md", "description": "Shared docs"}
+        ]
+    },
+    "dependencies": ["requests"],
+    "workspace": {"files": [], "ignore": [".git"]},
+}
+
+# Kit files other than kit.yaml; directory entries are created on extraction
+KIT_STATIC_FILES = [
+    ("actions/__init__.py", b"def init_action(): pass\ndef provided_func(): pass"),
+    ("actions/another.py", b"def setup_action(): pass"),
+    ("instructions/init_guide.md", b"# Init Guide"),
+    ("instructions/shared_docs.md", b"# Shared Docs"),
+    ("config/default.json", b'{"key": "value"}'),
+]
+
+# libyaml-backed dumper when available, pure-Python fallback otherwise
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# --- Helpers ---
+
+def build_tar(members) -> bytes:
+    """Build a tar.gz archive in memory from ``(name, data)`` pairs."""
+    buffer = io.BytesIO()
+    # Stream mode: consumers only read archives forward, so no seekable output is needed
+    with tarfile.open(fileobj=buffer, mode="w|gz") as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            info.mtime = 0
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+def versioned_kit_yaml(template: bytes, version: str) -> bytes:
+    """Fill the version placeholder of a pre-dumped kit.yaml (X.Y.Z versions only)."""
+    return template.replace(b"__VERSION__", version.encode())
+
+def create_kit_archive(config: Union[dict, bytes], arc_base: str = TEST_KIT_ID) -> io.BytesIO:
+    """Build a tar.gz kit archive in memory.
+
+    ``config`` is either a kit.yaml dict or already-serialized kit.yaml bytes,
+    which are written into the archive untouched.
+    """
+    kit_yaml = config if isinstance(config, bytes) else yaml.dump(config, Dumper=YAML_DUMPER).encode()
+
+    members = [(f"{arc_base}/kit.yaml", kit_yaml)]
+    members.extend((f"{arc_base}/{name}", data) for name, data in KIT_STATIC_FILES)
+    return io.BytesIO(build_tar(members))
+
+
+# --- Fixtures ---
+
+@pytest.fixture(scope="session")
+def kit_yaml_template() -> bytes:
+    """Sample kit.yaml dumped once per session with a version placeholder."""
+    dumped = yaml.dump(SAMPLE_KIT_CONFIG, Dumper=YAML_DUMPER)
+    return dumped.replace(f"version: {VALID_VERSION}", "version: __VERSION__").encode()
+
+@pytest.fixture(scope="session")
+def sample_kit_archive_bytes(kit_yaml_template: bytes) -> bytes:
+    return create_kit_archive(versioned_kit_yaml(kit_yaml_template, VALID_VERSION)).getvalue()
+
+@pytest.fixture(scope="session")
+def missing_version_archive_bytes() -> bytes:
+    kit_yaml = f"docVersion: v1\nid: {TEST_KIT_ID}\nname: Test Kit\nowner: {TEST_OWNER}\n".encode()
+    return build_tar([(f"{TEST_KIT_ID}/kit.yaml", kit_yaml)])
+
+@pytest.fixture(scope="session")
+def invalid_version_archive_bytes() -> bytes:
+    kit_yaml = f"docVersion: v1\nid: {TEST_KIT_ID}\nversion: '1.0'\nname: Test Kit\nowner: {TEST_OWNER}\n".encode()
+    return build_tar([(f"{TEST_KIT_ID}/kit.yaml", kit_yaml)])
+
+@pytest.fixture
+def sample_kit_archive(sample_kit_archive_bytes: bytes) -> io.BytesIO:
+    return io.BytesIO(sample_kit_archive_bytes)
+
+_kit_base_counter = itertools.count()
+
+@pytest.fixture(scope="session")
+def kits_root(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("kits_root")
+
+@pytest.fixture(scope="session")
+def shared_kit_service(kits_root: Path) -> KitService:
+    """One KitService for the whole session; tests get disjoint base paths."""
+    return KitService(base_path=kits_root)
+
+@pytest.fixture
+def kit_service(shared_kit_service: KitService, kits_root: Path):
+    shared_kit_service.base_path = kits_root / f"t{next(_kit_base_counter)}"
+    shared_kit_service.base_path.mkdir(parents=True, exist_ok=True)
+    yield shared_kit_service
+    shutil.rmtree(shared_kit_service.base_path, ignore_errors=True)
+
+@pytest.fixture
+def create_saved_kit(kit_service: KitService, sample_kit_archive: io.BytesIO) -> KitMetadata:
+    return kit_service.save_kit(sample_kit_archive)
+
+class FakeHttpxClient:
+    """Stand-in for httpx.Client that replays queued responses and records URLs.
+
+    A queued exception is raised instead of returned.
+    """
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+@pytest.fixture
+def fake_httpx_client() -> FakeHttpxClient:
+    return FakeHttpxClient()
+
+@pytest.fixture(autouse=True)
+def patch_httpx_client(monkeypatch, fake_httpx_client: FakeHttpxClient):
+    """Route every httpx.Client() created by KitService to the shared fake."""
+    monkeypatch.setattr(httpx, "Client", lambda *args, **kwargs: fake_httpx_client)
+
+@pytest.fixture
+def registry_env(monkeypatch):
+    monkeypatch.setenv("REGISTRY_URL", REGISTRY_URL)
+
+
+def collect_files(path: Path) -> set:
+    """Relative paths of all files under ``path``, gathered in one directory walk."""
+    return {
+        os.path.relpath(os.path.join(root, name), path)
+        for root, _, names in os.walk(path)
+        for name in names
+    }
+
+
+def make_response(status_code: int = 200, json_data: dict = None, content: bytes = b"") -> httpx.Response:
+    request = httpx.Request("GET", REGISTRY_URL)
+    if json_data is not None:
+        return httpx.Response(status_code, json=json_data, request=request)
+    return httpx.Response(status_code, content=content, request=request)
+
+
+# --- Test Cases ---
+
+class TestKitService:
+
+    @pytest.mark.parametrize("version, expected", [
+        ("1.0.0", True),
+        ("0.10.2", True),
+        ("10.20.30", True),
+        ("1.0", False),
+        ("1.0.0.0", False),
+        ("v1.0.0", False),
+        ("1.a.0", False),
+        ("", False),
+    ])
+    def test_validate_semantic_version(self, shared_kit_service: KitService, version: str, expected: bool):
+        assert shared_kit_service.validate_semantic_version(version) is expected
+
+    def test_get_kit_path(self, kit_service: KitService):
+        assert kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID) == kit_service.base_path / TEST_OWNER / TEST_KIT_ID
+        assert kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID, VALID_VERSION) == \
+            kit_service.base_path / TEST_OWNER / TEST_KIT_ID / VALID_VERSION
+
+    def test_save_kit_success(self, kit_service: KitService, sample_kit_archive: io.BytesIO):
+        metadata = kit_service.save_kit(sample_kit_archive)
+
+        assert isinstance(metadata, KitMetadata)
+        assert metadata.owner == TEST_OWNER
+        assert metadata.kit_id == TEST_KIT_ID
+        assert metadata.version == VALID_VERSION
+        assert metadata.name == "Test Kit"
+        assert metadata.environment[0]["name"] == "API_KEY"
+
+        files = collect_files(kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID, VALID_VERSION))
+        assert {
+            "kit.yaml",
+            "actions/__init__.py",
+            "instructions/init_guide.md",
+            "config/default.json",
+        } <= files
+
+    def test_save_kit_from_file(self, kit_service: KitService, sample_kit_archive_bytes: bytes, tmp_path: Path):
+        archive_path = tmp_path / "kit.tar.gz"
+        archive_path.write_bytes(sample_kit_archive_bytes)
+
+        # Hand the open file to save_kit so tarfile streams it; no read_bytes() copy
+        with open(archive_path, "rb") as archive_file:
+            metadata = kit_service.save_kit(archive_file)
+
+        assert metadata.version == VALID_VERSION
+        assert "kit.yaml" in collect_files(kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID, VALID_VERSION))
+
+    def test_save_kit_version_exists_no_overwrite(self, kit_service: KitService, create_saved_kit: KitMetadata, sample_kit_archive_bytes: bytes):
+        with pytest.raises(VersionExistsError):
+            kit_service.save_kit(io.BytesIO(sample_kit_archive_bytes), allow_overwrite=False)
+
+    def test_save_kit_overwrite(self, kit_service: KitService, create_saved_kit: KitMetadata, sample_kit_archive_bytes: bytes):
+        metadata = kit_service.save_kit(io.BytesIO(sample_kit_archive_bytes), allow_overwrite=True)
+        assert metadata.version == VALID_VERSION
+
+    def test_save_kit_missing_yaml(self, kit_service: KitService):
+        archive = build_tar([(f"{TEST_KIT_ID}/actions/__init__.py", b"def init_action(): pass")])
+
+        with pytest.raises(KitError, match="kit.yaml not found"):
+            kit_service.save_kit(io.BytesIO(archive))
+
+    def test_save_kit_invalid_yaml_format(self, kit_service: KitService):
+        archive = build_tar([(f"{TEST_KIT_ID}/kit.yaml", b"id: test\nversion: [invalid")])
+
+        with pytest.raises(KitError, match="Invalid kit.yaml"):
+            kit_service.save_kit(io.BytesIO(archive))
+
+    def test_save_kit_missing_required_fields(self, kit_service: KitService, missing_version_archive_bytes: bytes):
+        with pytest.raises(KitError, match="Missing required fields"):
+            kit_service.save_kit(io.BytesIO(missing_version_archive_bytes))
+
+    def test_save_kit_invalid_version(self, kit_service: KitService, invalid_version_archive_bytes: bytes):
+        with pytest.raises(InvalidVersionError):
+            kit_service.save_kit(io.BytesIO(invalid_version_archive_bytes))
+
+    def test_get_kit_config(self, kit_service: KitService, create_saved_kit: KitMetadata):
+        config = kit_service.get_kit_config(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+        assert isinstance(config, KitConfig)
+        assert config.id == TEST_KIT_ID
+        assert config.version == VALID_VERSION
+        assert config.agents[0].class_name == "TaskerAgent"
+        assert config.provide.instructions[0].name == "shared"
+        assert config.dependencies == ["requests"]
+
+    def test_get_kit_config_not_found(self, kit_service: KitService):
+        with pytest.raises(KitError, match="kit.yaml not found"):
+            kit_service.get_kit_config(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+    def test_get_kit_versions_success(self, kit_service: KitService, create_saved_kit: KitMetadata, kit_yaml_template: bytes):
+        kit_service.save_kit(create_kit_archive(versioned_kit_yaml(kit_yaml_template, VALID_VERSION_2)))
+
+        assert kit_service.get_kit_versions(TEST_OWNER, TEST_KIT_ID) == [VALID_VERSION, VALID_VERSION_2]
+        assert kit_service.get_kit_versions(TEST_OWNER, TEST_KIT_ID, sort=VersionSort.DESCENDING) == \
+            [VALID_VERSION_2, VALID_VERSION]
+
+    def test_get_kit_versions_not_found(self, kit_service: KitService):
+        with pytest.raises(KitNotFoundError):
+            kit_service.get_kit_versions(TEST_OWNER, "missing-kit")
+
+    def test_get_all_kits_empty(self, kit_service: KitService):
+        assert kit_service.get_all_kits() == []
+
+    def test_get_all_kits_multiple_versions(self, kit_service: KitService, create_saved_kit: KitMetadata, kit_yaml_template: bytes):
+        kit_service.save_kit(create_kit_archive(versioned_kit_yaml(kit_yaml_template, VALID_VERSION_2)))
+
+        kits = kit_service.get_all_kits()
+        assert [k.version for k in kits] == [VALID_VERSION, VALID_VERSION_2]
+        assert all(k.kit_id == TEST_KIT_ID for k in kits)
+
+    def test_get_kit_content_path_invalid_version(self, kit_service: KitService):
+        with pytest.raises(InvalidVersionError):
+            kit_service.get_kit_content_path(TEST_OWNER, TEST_KIT_ID, "latest")
+
+    def test_delete_kit_version_multiple_exist(self, kit_service: KitService, create_saved_kit: KitMetadata, kit_yaml_template: bytes):
+        kit_service.save_kit(create_kit_archive(versioned_kit_yaml(kit_yaml_template, VALID_VERSION_2)))
+
+        kit_service.delete_kit_version(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+        assert not kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID, VALID_VERSION).exists()
+        assert kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID, VALID_VERSION_2).exists()
+
+    def test_delete_kit_version_last_removes_parents(self, kit_service: KitService, create_saved_kit: KitMetadata):
+        kit_service.delete_kit_version(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+        assert not kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID).exists()
+        assert not (kit_service.base_path / TEST_OWNER).exists()
+
+    def test_delete_kit_version_not_found(self, kit_service: KitService):
+        with pytest.raises(KitNotFoundError):
+            kit_service.delete_kit_version(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+    def test_delete_kit_success(self, kit_service: KitService, create_saved_kit: KitMetadata, kit_yaml_template: bytes):
+        kit_service.save_kit(create_kit_archive(versioned_kit_yaml(kit_yaml_template, VALID_VERSION_2)))
+
+        kit_service.delete_kit(TEST_OWNER, TEST_KIT_ID)
+
+        assert not kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID).exists()
+        assert not (kit_service.base_path / TEST_OWNER).exists()
+
+    def test_delete_kit_not_found(self, kit_service: KitService):
+        with pytest.raises(KitNotFoundError):
+            kit_service.delete_kit(TEST_OWNER, TEST_KIT_ID)
+
+    def test_install_kit_no_registry_url(self, kit_service: KitService, monkeypatch):
+        monkeypatch.delenv("REGISTRY_URL", raising=False)
+        with pytest.raises(KitError, match="REGISTRY_URL"):
+            kit_service.install_kit(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+    def test_install_kit_specific_version_success(self, kit_service: KitService, registry_env, fake_httpx_client: FakeHttpxClient, sample_kit_archive_bytes: bytes):
+        download_url = f"{REGISTRY_URL}/downloads/{TEST_KIT_ID}.tar.gz"
+        fake_httpx_client.responses = [
+            make_response(json_data={"downloadUrl": download_url}),
+            make_response(content=sample_kit_archive_bytes),
+        ]
+
+        metadata = kit_service.install_kit(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+        assert metadata.version == VALID_VERSION
+        assert fake_httpx_client.calls == [
+            f"{REGISTRY_URL}/api/kits/{TEST_OWNER}/{TEST_KIT_ID}/{VALID_VERSION}",
+            download_url,
+        ]
+        assert kit_service.get_kit_path(TEST_OWNER, TEST_KIT_ID, VALID_VERSION).exists()
+
+    def test_install_kit_not_found(self, kit_service: KitService, registry_env, fake_httpx_client: FakeHttpxClient):
+        fake_httpx_client.responses = [make_response(status_code=404)]
+
+        with pytest.raises(KitNotFoundError):
+            kit_service.install_kit(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+    def test_install_kit_registry_error(self, kit_service: KitService, registry_env, fake_httpx_client: FakeHttpxClient):
+        fake_httpx_client.responses = [httpx.ConnectError("connection refused")]
+
+        with pytest.raises(RegistryError):
+            kit_service.install_kit(TEST_OWNER, TEST_KIT_ID, VALID_VERSION)
+
+    def test_check_registry_kit_exists(self, kit_service: KitService, registry_env, fake_httpx_client: FakeHttpxClient):
+        fake_httpx_client.responses = [make_response(json_data={}), make_response(status_code=404)]
+
+        assert kit_service.check_registry_kit_exists(TEST_OWNER, TEST_KIT_ID, VALID_VERSION) is True
+        assert kit_service.check_registry_kit_exists(TEST_OWNER, TEST_KIT_ID, VALID_VERSION_2) is False
@@ -1,27 +1,28 @@
 # tests/services/core/test_module.py
 
 import pytest
-from unittest.mock import MagicMock, patch, ANY
+from unittest.mock import Mock, ANY, create_autospec
 from pathlib import Path
-import io
-import zipfile
+from types import SimpleNamespace
+from typing import Optional
 from datetime import datetime, UTC
-from contextlib import contextmanager
 import shutil # Ensure shutil is imported
 
-import networkx as nx
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
 
+import engine.services.core.module as core_module
 from engine.services.core.module import (
     ModuleService,
     ModuleMetadata,
     ModuleError
 )
-from engine.services.storage.workspace import WorkspaceService, WorkspaceNotFoundError
+from engine.services.core.kit import KitService
 from engine.services.execution.state import StateService
-from engine.services.core.kit import KitService, KitConfig
-from engine.db.models import Module, Project, ProjectModuleMapping, ProvideType, ModuleProvide
-from engine.utils.file import extract_zip
+from engine.services.storage.workspace import WorkspaceService
+from engine.db.models import Module, Project, ProjectModuleMapping, ModuleProvide
+
+pytestmark = pytest.mark.xdist_group(name="db_core")
 
 # --- Constants ---
 TEST_PROJECT_ID = "prj-test-123"
@@ -30,83 +31,109 @@ TEST_KIT_ID = "test-kit"
 TEST_VERSION = "1.0.0"
 TEST_MODULE_ID_1 = "mod-abc"
 TEST_MODULE_ID_2 = "mod-def"
+RO_PROJECT_ID = "prj-ro-456"
+RO_MODULE_ID = "mod-ro"
+FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
 
 # --- Fixtures ---
 
-@pytest.fixture
-def mock_repo_service() -> MagicMock:
-    service = MagicMock(spec=WorkspaceService)
-    service.create_repository = MagicMock()
-    service.delete_repository = MagicMock()
-    service.add_submodule = MagicMock()
-    service.remove_submodule = MagicMock()
-    return service
+# Service doubles are autospec'd once per session and reset before every test
+# that uses them; create_autospec checks calls against the real service signatures
 
-@pytest.fixture
-def mock_state_service() -> MagicMock:
-    service = MagicMock(spec=StateService)
-    service.initialize_module = MagicMock()
-    return service
+@pytest.fixture(scope="session")
+def dummy_kit_config() -> SimpleNamespace:
+    return SimpleNamespace(owner=TEST_OWNER, id=TEST_KIT_ID, version=TEST_VERSION)
+
+@pytest.fixture(scope="session")
+def _repo_service_template() -> Mock:
+    return create_autospec(WorkspaceService, instance=True)
+
+@pytest.fixture(scope="session")
+def _state_service_template() -> Mock:
+    return create_autospec(StateService, instance=True)
+
+@pytest.fixture(scope="session")
+def _kit_service_template(dummy_kit_config: SimpleNamespace) -> Mock:
+    kit_service = create_autospec(KitService, instance=True)
+    kit_service.get_kit_config.return_value = dummy_kit_config
+    return kit_service
 
 @pytest.fixture
-def mock_kit_service() -> MagicMock:
-    service = MagicMock(spec=KitService)
-    dummy_kit_config = MagicMock(spec=KitConfig)
-    dummy_kit_config.owner = TEST_OWNER
-    dummy_kit_config.id = TEST_KIT_ID
-    dummy_kit_config.version = TEST_VERSION
-    service.get_kit_config.return_value = dummy_kit_config
-    return service
+def mock_repo_service(_repo_service_template: Mock) -> Mock:
+    _repo_service_template.reset_mock(return_value=True, side_effect=True)
+    return _repo_service_template
 
 @pytest.fixture
-def module_service(
-    tmp_path: Path,
-    db_session: Session,
-    mock_repo_service: MagicMock,
-    mock_state_service: MagicMock,
-    mock_kit_service: MagicMock
-) -> ModuleService:
-    workspace_base = tmp_path / "kits"
-    module_base = tmp_path / "module_kits"
+def mock_state_service(_state_service_template: Mock) -> Mock:
+    _state_service_template.reset_mock(return_value=True, side_effect=True)
+    return _state_service_template
 
-    service = ModuleService(
-        workspace_base=str(workspace_base),
-        module_base=str(module_base),
-        workspace_service=mock_repo_service,
-        state_service=mock_state_service,
-        kit_service=mock_kit_service
-    )
+@pytest.fixture
+def mock_kit_service(_kit_service_template: Mock, dummy_kit_config: SimpleNamespace) -> Mock:
+    _kit_service_template.reset_mock(return_value=True, side_effect=True)
+    _kit_service_template.get_kit_config.return_value = dummy_kit_config
+    return _kit_service_template
 
-    # Create a context manager factory
-    @contextmanager
-    def test_db_context():
-        yield db_session
-        
-    # Override the _get_db method to return our context manager factory
-    service._get_db = test_db_context
+@pytest.fixture(scope="session")
+def _workspace_root(tmp_path_factory) -> Path:
+    """Kit workspace tree shared by every test; tests must not modify it."""
+    return _build_workspace_tree(tmp_path_factory.mktemp("kits"))
 
+def _build_workspace_tree(workspace_base: Path) -> Path:
     dummy_workspace = workspace_base / TEST_OWNER / TEST_KIT_ID / TEST_VERSION / "workspace"
-    dummy_workspace.mkdir(parents=True, exist_ok=True)
+    dummy_workspace.mkdir(parents=True)
     (dummy_workspace / "dummy_file.txt").touch()
+    return workspace_base
 
-    return service
+@pytest.fixture
+def make_module_service(
+    tmp_path: Path,
+    _workspace_root: Path,
+    mock_db_context,
+    mock_repo_service: Mock,
+    mock_state_service: Mock,
+    mock_kit_service: Mock
+):
+    """Factory for ModuleService; workspace_base_path defaults to the shared tree."""
+    def _make(workspace_base_path: Optional[Path] = None) -> ModuleService:
+        service = ModuleService(
+            workspace_base=str(workspace_base_path or _workspace_root),
+            module_base=str(tmp_path / "module_kits"),
+            workspace_service=mock_repo_service,
+            state_service=mock_state_service,
+            kit_service=mock_kit_service
+        )
+        service._get_db = mock_db_context
+
+        return service
+
+    return _make
+
+@pytest.fixture
+def module_service(make_module_service) -> ModuleService:
+    return make_module_service()
 
 @pytest.fixture
 def create_db_project(db_session: Session) -> Project:
-    project = Project(id=TEST_PROJECT_ID, name="Test Project", created_at=datetime.now(UTC))
-    # Defensive check in case previous test run failed rollback
-    existing = db_session.get(Project, TEST_PROJECT_ID)
-    if existing:
-        return existing
+    project = Project(id=TEST_PROJECT_ID, name="Test Project", created_at=FIXED_TS)
     db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    db_session.flush()
     return project
 
+def _load_with_mappings(db_session: Session, module_id: str) -> Module:
+    """Reload a module with project_mappings eagerly joined, so tests reading
+    project_mappings[0] don't issue a lazy SELECT."""
+    stmt = (
+        select(Module)
+        .options(joinedload(Module.project_mappings))
+        .where(Module.module_id == module_id)
+    )
+    return db_session.execute(stmt).unique().scalar_one()
+
 @pytest.fixture
 def create_db_module(db_session: Session, create_db_project: Project) -> Module:
-    created_at_dt = datetime.now(UTC) # Use datetime object
+    created_at_dt = FIXED_TS
     module = Module(
         module_id=TEST_MODULE_ID_1,
         module_name="Test Module 1",
@@ -117,18 +144,6 @@ def create_db_module(db_session: Session, create_db_project: Project) -> Module:
         env_vars={"KEY": "VALUE"},
         workspace_name=f"{TEST_MODULE_ID_1}-repo"
     )
-    # Defensive check
-    existing = db_session.get(Module, TEST_MODULE_ID_1)
-    if existing:
-        # Ensure mapping exists if module does
-        mapping = db_session.get(ProjectModuleMapping, (create_db_project.id, existing.module_id))
-        if not mapping:
-             mapping = ProjectModuleMapping(project_id=create_db_project.id, module_id=existing.module_id, path="test.module.one", created_at=existing.created_at, updated_at=existing.created_at)
-             db_session.add(mapping)
-             db_session.commit()
-        return existing
-
-
     mapping = ProjectModuleMapping(
         project_id=create_db_project.id,
         module_id=module.module_id,
@@ -136,16 +151,13 @@ def create_db_module(db_session: Session, create_db_project: Project) -> Module:
         created_at=created_at_dt,
         updated_at=created_at_dt
     )
-    db_session.add(module)
-    db_session.add(mapping)
-    db_session.commit()
-    db_session.refresh(module)
-    db_session.refresh(mapping) # Refresh mapping too
-    return module
+    db_session.add_all([module, mapping])
+    db_session.flush()
+    return _load_with_mappings(db_session, module.module_id)
 
 @pytest.fixture
 def create_db_module_2(db_session: Session, create_db_project: Project) -> Module:
-    created_at_dt = datetime.now(UTC) # Use datetime object
+    created_at_dt = FIXED_TS
     module = Module(
         module_id=TEST_MODULE_ID_2,
         module_name="Test Module 2",
@@ -156,16 +168,6 @@ def create_db_module_2(db_session: Session, create_db_project: Project) -> Modul
         env_vars={},
         workspace_name=f"{TEST_MODULE_ID_2}-repo"
     )
-    # Defensive check
-    existing = db_session.get(Module, TEST_MODULE_ID_2)
-    if existing:
-         mapping = db_session.get(ProjectModuleMapping, (create_db_project.id, existing.module_id))
-         if not mapping:
-             mapping = ProjectModuleMapping(project_id=create_db_project.id, module_id=existing.module_id, path="test.module.two", created_at=existing.created_at, updated_at=existing.created_at)
-             db_session.add(mapping)
-             db_session.commit()
-         return existing
-
     mapping = ProjectModuleMapping(
         project_id=create_db_project.id,
         module_id=module.module_id,
@@ -173,17 +175,60 @@ def create_db_module_2(db_session: Session, create_db_project: Project) -> Modul
         created_at=created_at_dt,
         updated_at=created_at_dt
     )
-    db_session.add(module)
-    db_session.add(mapping)
-    db_session.commit()
-    db_session.refresh(module)
-    db_session.refresh(mapping)
+    db_session.add_all([module, mapping])
+    db_session.flush()
+    return _load_with_mappings(db_session, module.module_id)
+
+# Read-only tests share one service and one seeded module per test module
+
+@pytest.fixture(scope="module")
+def ro_module_service(
+    tmp_path_factory,
+    _workspace_root: Path,
+    module_db_session: Session,
+    make_db_context,
+    _repo_service_template: Mock,
+    _state_service_template: Mock,
+    _kit_service_template: Mock
+) -> ModuleService:
+    service = ModuleService(
+        workspace_base=str(_workspace_root),
+        module_base=str(tmp_path_factory.mktemp("ro_module_kits")),
+        workspace_service=_repo_service_template,
+        state_service=_state_service_template,
+        kit_service=_kit_service_template
+    )
+    service._get_db = make_db_context(module_db_session)
+    return service
+
+@pytest.fixture(scope="module")
+def ro_db_module(module_db_session: Session) -> Module:
+    project = Project(id=RO_PROJECT_ID, name="Read-only Project", created_at=FIXED_TS)
+    module = Module(
+        module_id=RO_MODULE_ID,
+        module_name="Read-only Module",
+        kit_id=TEST_KIT_ID,
+        owner=TEST_OWNER,
+        version=TEST_VERSION,
+        created_at=FIXED_TS,
+        env_vars={"KEY": "VALUE"},
+        workspace_name=f"{RO_MODULE_ID}-repo"
+    )
+    mapping = ProjectModuleMapping(
+        project_id=RO_PROJECT_ID,
+        module_id=RO_MODULE_ID,
+        path="test.module.one",
+        created_at=FIXED_TS,
+        updated_at=FIXED_TS
+    )
+    module_db_session.add_all([project, module, mapping])
+    module_db_session.flush()
     return module
 
 # Helper functions for module provides tests
 def create_module_provide_in_db(db_session, provider_id, receiver_id, resource_type, description=None):
     """Create a ModuleProvide instance directly in the database"""
-    now = datetime.now(UTC)
+    now = FIXED_TS
     provide = ModuleProvide(
         provider_id=provider_id,
         receiver_id=receiver_id,
@@ -201,24 +246,24 @@ def create_module_provide_in_db(db_session, provider_id, receiver_id, resource_t
 
 class TestModuleService:
 
-    def test_validate_path(self, module_service: ModuleService):
-        assert module_service._validate_path("valid.path") is True
-        assert module_service._validate_path("a.b.c.1") is True
-        assert module_service._validate_path("single") is True
-        assert module_service._validate_path("invalid path") is False
-        assert module_service._validate_path("invalid-path") is False
-        assert module_service._validate_path(".start") is False
-        assert module_service._validate_path("end.") is False
-        assert module_service._validate_path("a..b") is False
-
-    @patch('engine.services.core.module.generate_readable_uid', return_value='new-mod-id')
-    @patch('engine.services.core.module.datetime')
-    def test_create_module_success(self, mock_datetime, mock_generate_uid, module_service: ModuleService, create_db_project: Project, mock_repo_service: MagicMock, mock_state_service: MagicMock, db_session: Session):
-        # Mock datetime to return a real datetime object, not a string
-        mock_now = datetime.now(UTC)
-        mock_datetime.now.return_value = mock_now
-        mock_datetime.UTC = UTC
-        
+    @pytest.mark.parametrize("path, expected", [
+        ("valid.path", True),
+        ("a.b.c.1", True),
+        ("single", True),
+        ("invalid path", False),
+        ("invalid-path", False),
+        (".start", False),
+        ("end.", False),
+        ("a..b", False),
+    ])
+    def test_validate_path(self, module_service: ModuleService, path: str, expected: bool):
+        assert module_service._validate_path(path) is expected
+
+    def test_create_module_success(self, monkeypatch, module_service: ModuleService, create_db_project: Project, mock_repo_service: Mock, mock_state_service: Mock, db_session: Session):
+        # Plain attribute swaps on the module under test; no mock.patch machinery needed
+        monkeypatch.setattr(core_module, "generate_readable_uid", lambda: 'new-mod-id')
+        monkeypatch.setattr(core_module, "datetime", SimpleNamespace(now=lambda tz=None: FIXED_TS))
+
         project_id = create_db_project.id
         owner = TEST_OWNER
         kit_id = TEST_KIT_ID
@@ -248,11 +293,11 @@ class TestModuleService:
         assert db_mapping is not None
         assert db_mapping.path == path
 
-        mock_repo_service.create_repository.assert_called_once_with(
+        mock_repo_service.create_workspace.assert_called_once_with(
             workspace_name=metadata.workspace_name,
             content_file=ANY,
             filename="workspace.zip",
-            extract_func=extract_zip
+            extract_func=core_module.extract_zip
         )
         mock_state_service.initialize_module.assert_called_once_with(metadata.module_id)
 
@@ -260,12 +305,27 @@ class TestModuleService:
         with pytest.raises(ModuleError, match="Invalid path format"):
             module_service.create_module(create_db_project.id, TEST_OWNER, TEST_KIT_ID, TEST_VERSION, {}, "invalid path")
 
-    def test_create_module_workspace_not_found(self, module_service: ModuleService, create_db_project: Project):
-        if module_service.workspace_base.exists():
-             shutil.rmtree(module_service.workspace_base)
+    @pytest.mark.slowpath
+    def test_create_module_workspace_not_found(self, make_module_service, create_db_project: Project, tmp_path: Path):
+        # Throwaway tree so the shared session workspace stays intact
+        ephemeral_base = _build_workspace_tree(tmp_path / "ephemeral")
+        module_service = make_module_service(workspace_base_path=ephemeral_base)
+        shutil.rmtree(ephemeral_base)
         with pytest.raises(ModuleError, match="Workspace not found"):
             module_service.create_module(create_db_project.id, TEST_OWNER, TEST_KIT_ID, TEST_VERSION, {}, "a.b.c")
 
+    @pytest.mark.slowpath
+    def test_create_module_workspace_error(self, monkeypatch, module_service: ModuleService, create_db_project: Project, mock_repo_service: Mock, db_session: Session):
+        monkeypatch.setattr(core_module, "generate_readable_uid", lambda: 'failed-mod-id')
+        mock_repo_service.create_workspace.side_effect = RuntimeError("disk full")
+
+        with pytest.raises(ModuleError, match="Failed to create module: disk full"):
+            module_service.create_module(create_db_project.id, TEST_OWNER, TEST_KIT_ID, TEST_VERSION, {}, "a.b.c")
+
+        # The partially created workspace is cleaned up and nothing reaches the DB
+        mock_repo_service.delete_workspace.assert_called_once_with('failed-mod-id')
+        assert db_session.get(Module, 'failed-mod-id') is None
+
     def test_update_module_path_success(self, module_service: ModuleService, create_db_module: Module, db_session: Session):
         new_path = "updated.module.path"
         module_id = create_db_module.module_id
@@ -280,16 +340,45 @@ class TestModuleService:
     def test_get_project_modules(self, module_service: ModuleService, create_db_module: Module):
         project_id = create_db_module.project_mappings[0].project_id
         modules = module_service.get_project_modules(project_id)
-        assert len(modules) >= 1 # Allow for potential default project modules if tests run together
-        assert any(m.module_id == create_db_module.module_id for m in modules)
-        test_module_meta = next(m for m in modules if m.module_id == create_db_module.module_id)
+        by_id = {m.module_id: m for m in modules}
+        assert len(by_id) >= 1 # Allow for potential default project modules if tests run together
+        assert create_db_module.module_id in by_id
+        test_module_meta = by_id[create_db_module.module_id]
         assert isinstance(test_module_meta, ModuleMetadata)
         assert test_module_meta.path == "test.module.one"
 
-
-
-
-    def test_delete_module_success(self, module_service: ModuleService, create_db_module: Module, db_session: Session, mock_repo_service: MagicMock):
+    def test_get_project_modules_raw(self, module_service: ModuleService, create_db_module: Module):
+        project_id = create_db_module.project_mappings[0].project_id
+        by_id = {m["module_id"]: m for m in module_service.get_project_modules_raw(project_id)}
+        row = by_id[create_db_module.module_id]
+
+        # SQLite drops the timezone, so only compare the wall-clock prefix
+        assert row.pop("created_at").startswith(FIXED_TS.replace(tzinfo=None).isoformat())
+        # Same values as ModuleMetadata, as plain JSON-ready dicts
+        assert row == {
+            "module_id": create_db_module.module_id,
+            "module_name": "Test Module 1",
+            "project_id": project_id,
+            "kit_id": TEST_KIT_ID,
+            "owner": TEST_OWNER,
+            "version": TEST_VERSION,
+            "env_vars": {"KEY": "VALUE"},
+            "workspace_name": create_db_module.workspace_name,
+            "path": "test.module.one",
+        }
+
+
+
+
+    def test_get_module_graph(self, module_service: ModuleService, create_db_module: Module, create_db_module_2: Module):
+        graph = module_service.get_module_graph()
+        assert set(graph.nodes) >= {create_db_module.module_id, create_db_module_2.module_id}
+        node = graph.nodes[create_db_module.module_id]
+        assert node["project_id"] == TEST_PROJECT_ID
+        assert node["path"] == "test.module.one"
+        assert node["workspace_name"] == create_db_module.workspace_name
+
+    def test_delete_module_success(self, module_service: ModuleService, create_db_module: Module, db_session: Session, mock_repo_service: Mock):
         module_id = create_db_module.module_id
         workspace_name = create_db_module.workspace_name
         project_id = create_db_module.project_mappings[0].project_id
@@ -301,20 +390,20 @@ class TestModuleService:
         assert db_session.get(Module, module_id) is None
         # Cascading should delete the mapping too, verify this way
         assert db_session.query(ProjectModuleMapping).filter_by(module_id=module_id).count() == 0
-        mock_repo_service.delete_repository.assert_called_once_with(workspace_name)
+        mock_repo_service.delete_workspace.assert_called_once_with(workspace_name)
 
 
 
-    def test_get_module_metadata_success(self, module_service: ModuleService, create_db_module: Module):
-        metadata = module_service.get_module_metadata(create_db_module.module_id)
+    def test_get_module_metadata_success(self, ro_module_service: ModuleService, ro_db_module: Module):
+        metadata = ro_module_service.get_module_metadata(ro_db_module.module_id)
         assert isinstance(metadata, ModuleMetadata)
-        assert metadata.module_id == create_db_module.module_id
-        assert metadata.module_name == create_db_module.module_name
+        assert metadata.module_id == ro_db_module.module_id
+        assert metadata.module_name == ro_db_module.module_name
         assert metadata.path == "test.module.one"
 
-    def test_get_module_metadata_not_found(self, module_service: ModuleService):
+    def test_get_module_metadata_not_found(self, ro_module_service: ModuleService):
         with pytest.raises(ModuleError, match="Module non-existent-mod not found"):
-            module_service.get_module_metadata("non-existent-mod")
+            ro_module_service.get_module_metadata("non-existent-mod")
 
     def test_update_module_name_success(self, module_service: ModuleService, create_db_module: Module, db_session: Session):
         new_name = "Updated Module Name"
@@ -336,9 +425,9 @@ class TestModuleService:
         updated_module = db_session.get(Module, create_db_module.module_id)
         assert updated_module.env_vars[var_name] == var_value
 
-    def test_get_module_kit_config(self, module_service: ModuleService, create_db_module: Module, mock_kit_service: MagicMock):
+    def test_get_module_kit_config(self, module_service: ModuleService, create_db_module: Module, mock_kit_service: Mock):
         config = module_service.get_module_kit_config(create_db_module.module_id)
-        assert isinstance(config, MagicMock)
+        assert config.owner == TEST_OWNER
         mock_kit_service.get_kit_config.assert_called_once_with(
             owner=TEST_OWNER,
             kit_id=TEST_KIT_ID,
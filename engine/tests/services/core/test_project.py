@@ -2,36 +2,49 @@
 
 import pytest
 from datetime import datetime, UTC
-from contextlib import contextmanager # Import contextmanager
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 import uuid
+from unittest.mock import MagicMock, patch
 
 from engine.services.core.project import ProjectService, ProjectMetadata, ProjectError
 from engine.db.models import Project
 
+pytestmark = pytest.mark.xdist_group(name="db_core")
+
+FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+DEFAULT_PROJECT_ID = "00000000-0000-0000-0000-000000000000"
+
 # --- Test Fixtures ---
 
+@pytest.fixture(autouse=True, scope="module")
+def _patch_session_local():
+    """
+    Patch SessionLocal once per module so ProjectService.__init__ (which runs
+    _ensure_default_project) never reaches the real database.
+    """
+    patcher = patch('engine.services.core.project.SessionLocal')
+    session_local = patcher.start()
+    yield session_local
+    patcher.stop()
+
+@pytest.fixture(scope="module")
+def mock_db_session(_patch_session_local: MagicMock) -> MagicMock:
+    """Session handed out by the patched SessionLocal; `with` yields the same mock."""
+    session = MagicMock()
+    session.__enter__.return_value = session
+    _patch_session_local.return_value = session
+    return session
+
+@pytest.fixture(autouse=True)
+def _reset_mock_db_session(mock_db_session: MagicMock):
+    yield
+    mock_db_session.reset_mock(side_effect=True)
+
 @pytest.fixture
-def project_service(db_session: Session) -> ProjectService: # Use db_session directly
+def project_service(_patch_session_local: MagicMock, mock_db_context) -> ProjectService:
     """Fixture providing a ProjectService instance patched with the test DB context."""
     service = ProjectService()
-
-    # Define the function that returns the context manager yielding the db_session
-    def get_test_db():
-        @contextmanager
-        def test_db_context():
-            try:
-                yield db_session
-            finally:
-                # No specific cleanup needed here as db_session handles rollback/close
-                pass
-        # Return the actual context manager instance
-        return test_db_context()
-
-    # Directly assign the function (which returns the context manager)
-    # to the service's internal method
-    service._get_db = get_test_db
+    service._get_db = mock_db_context
     yield service # yield the patched service
 
 @pytest.fixture
@@ -40,65 +53,72 @@ def create_test_project(db_session: Session) -> Project:
     project = Project(
         id=str(uuid.uuid4()),
         name="test-project-1",
-        created_at=datetime.now(UTC)
+        created_at=FIXED_TS
     )
     db_session.add(project)
-    db_session.commit()
-    db_session.refresh(project)
+    db_session.flush()
+    return project
+
+@pytest.fixture
+def default_project(db_session: Session) -> Project:
+    """Fixture ensuring the default project row exists in the DB."""
+    project = db_session.get(Project, DEFAULT_PROJECT_ID)
+    if project is None:
+        project = Project(id=DEFAULT_PROJECT_ID, name="default", created_at=FIXED_TS)
+        db_session.add(project)
+        db_session.flush()
+    return project
+
+@pytest.fixture(scope="module")
+def ro_project_service(_patch_session_local: MagicMock, module_db_session: Session, make_db_context) -> ProjectService:
+    """ProjectService bound to the module-wide session, for tests that only read."""
+    service = ProjectService()
+    service._get_db = make_db_context(module_db_session)
+    return service
+
+@pytest.fixture(scope="module")
+def ro_test_project(module_db_session: Session) -> Project:
+    """Project seeded once for the read-only tests of this module."""
+    project = Project(id=str(uuid.uuid4()), name="ro-test-project", created_at=FIXED_TS)
+    module_db_session.add(project)
+    module_db_session.flush()
     return project
 
+@pytest.fixture(scope="module")
+def orm_project() -> Project:
+    """Transient Project built once per module; only read, never added to a session."""
+    return Project(id="orm-test-id", name="orm-test-name", created_at=FIXED_TS)
+
 # --- Test Cases ---
 
 class TestProjectService:
 
-    def test_ensure_default_project_creation(self, db_session: Session): # Use db_session
+    def test_ensure_default_project_creation(self, project_service: ProjectService, db_session: Session):
         """Test that the default project is created if it doesn't exist."""
-        existing_default = db_session.get(Project, "00000000-0000-0000-0000-000000000000")
-        if existing_default:
-            db_session.delete(existing_default)
-            db_session.commit()
-
-        # Create a temporary service instance *for this test* to trigger init
-        temp_service = ProjectService()
-        # Patch its _get_db for the duration of the init call in this test
-        def get_temp_test_db():
-            @contextmanager
-            def temp_test_db_context():
-                yield db_session
-            return temp_test_db_context()
-        temp_service._get_db = get_temp_test_db
-        temp_service._ensure_default_project() # Call the method directly
+        project_service._ensure_default_project()
 
         # Verify default project now exists in the DB
-        default_project = db_session.get(Project, "00000000-0000-0000-0000-000000000000")
+        default_project = db_session.get(Project, DEFAULT_PROJECT_ID)
         assert default_project is not None
         assert default_project.name == "default"
-        assert default_project.id == "00000000-0000-0000-0000-000000000000"
+        assert default_project.id == DEFAULT_PROJECT_ID
 
-    def test_ensure_default_project_already_exists(self, db_session: Session): # Use db_session
+    def test_ensure_default_project_already_exists(self, project_service: ProjectService, db_session: Session, default_project: Project):
         """Test that initializing the service doesn't fail if default project exists."""
-        default_id = "00000000-0000-0000-0000-000000000000"
-        if not db_session.get(Project, default_id):
-            default_project = Project(id=default_id, name="default", created_at=datetime.now(UTC))
-            db_session.add(default_project)
-            db_session.commit()
-
-        # Initialize service - should not raise an error
         try:
-            temp_service = ProjectService()
-            def get_temp_test_db():
-                @contextmanager
-                def temp_test_db_context():
-                    yield db_session
-                return temp_test_db_context()
-            temp_service._get_db = get_temp_test_db
-            temp_service._ensure_default_project()
+            project_service._ensure_default_project()
         except Exception as e:
             pytest.fail(f"_ensure_default_project raised an exception unexpectedly: {e}")
 
-        assert db_session.get(Project, default_id) is not None
+        assert db_session.get(Project, DEFAULT_PROJECT_ID) is not None
 
 
+    @pytest.mark.slowpath
+    def test_ensure_default_project_db_error(self, mock_db_session: MagicMock):
+        mock_db_session.query.side_effect = Exception("connection refused")
+        with pytest.raises(ProjectError, match="Failed to ensure default project: connection refused"):
+            ProjectService()
+
     def test_create_project_success(self, project_service: ProjectService, db_session: Session):
         project_name = "new-project-success"
         result = project_service.create_project(project_name)
@@ -111,66 +131,57 @@ class TestProjectService:
         assert db_project is not None
         assert db_project.name == project_name
 
+    def test_create_project_uses_id_factory(self, _patch_session_local: MagicMock, db_session: Session, mock_db_context):
+        service = ProjectService(id_factory=lambda: "fixed-project-id")
+        service._get_db = mock_db_context
+
+        result = service.create_project("factory-project")
+
+        assert result.id == "fixed-project-id"
+        assert db_session.get(Project, "fixed-project-id").name == "factory-project"
+
+    @pytest.mark.slowpath
     def test_create_project_duplicate_name(self, project_service: ProjectService, create_test_project: Project):
         duplicate_name = create_test_project.name
         with pytest.raises(ProjectError, match=f"Project with name '{duplicate_name}' already exists"):
             project_service.create_project(duplicate_name)
 
-    def test_get_project_success(self, project_service: ProjectService, create_test_project: Project):
-        result = project_service.get_project(create_test_project.id)
+    def test_get_project_success(self, ro_project_service: ProjectService, ro_test_project: Project):
+        result = ro_project_service.get_project(ro_test_project.id)
 
         assert isinstance(result, ProjectMetadata)
-        assert result.id == create_test_project.id
-        assert result.name == create_test_project.name
-        assert result.created_at == create_test_project.created_at.isoformat()
+        assert result.id == ro_test_project.id
+        assert result.name == ro_test_project.name
+        assert result.created_at == ro_test_project.created_at.isoformat()
 
-    def test_get_project_not_found(self, project_service: ProjectService):
+    def test_get_project_not_found(self, ro_project_service: ProjectService):
         non_existent_id = str(uuid.uuid4())
-        result = project_service.get_project(non_existent_id)
+        result = ro_project_service.get_project(non_existent_id)
         assert result is None
 
-    def test_get_all_projects(self, project_service: ProjectService, db_session: Session, create_test_project: Project):
-        # Ensure default project exists for this test run
-        default_id = "00000000-0000-0000-0000-000000000000"
-        if not db_session.get(Project, default_id):
-             default_project = Project(id=default_id, name="default", created_at=datetime.now(UTC))
-             db_session.add(default_project)
-             db_session.commit()
-
+    def test_get_all_projects(self, project_service: ProjectService, db_session: Session, create_test_project: Project, default_project: Project):
         # Create another project for testing multiple retrieval
-        project2 = Project(id=str(uuid.uuid4()), name="another-test-project", created_at=datetime.now(UTC))
+        project2 = Project(id=str(uuid.uuid4()), name="another-test-project", created_at=FIXED_TS)
         db_session.add(project2)
-        db_session.commit()
+        db_session.flush()
 
         results = project_service.get_all_projects()
 
         assert isinstance(results, list)
-        project_ids = {p.id for p in results}
-        assert len(project_ids) >= 3 # Default, create_test_project, project2
-        assert default_id in project_ids
-        assert create_test_project.id in project_ids
-        assert project2.id in project_ids
-        assert all(isinstance(p, ProjectMetadata) for p in results)
-
-    def test_get_all_projects_includes_default(self, project_service: ProjectService, db_session: Session):
-        default_id = "00000000-0000-0000-0000-000000000000"
-        if not db_session.get(Project, default_id):
-            default_project = Project(id=default_id, name="default", created_at=datetime.now(UTC))
-            db_session.add(default_project)
-            db_session.commit()
+        by_id = {p.id: p for p in results}
+        assert len(by_id) >= 3 # Default, create_test_project, project2
+        assert DEFAULT_PROJECT_ID in by_id
+        assert by_id[create_test_project.id].name == create_test_project.name
+        assert by_id[project2.id].name == project2.name
+        assert all(isinstance(p, ProjectMetadata) for p in by_id.values())
 
-        results = project_service.get_all_projects()
-        assert any(p.id == default_id for p in results)
+    def test_get_all_projects_includes_default(self, project_service: ProjectService, default_project: Project):
+        by_id = {p.id: p for p in project_service.get_all_projects()}
+        assert by_id[DEFAULT_PROJECT_ID].name == "default"
 
-    def test_project_metadata_from_orm(self):
-        created_time = datetime.now(UTC)
-        project_orm = Project(
-            id="orm-test-id",
-            name="orm-test-name",
-            created_at=created_time
-        )
-        metadata = ProjectMetadata.from_orm(project_orm)
+    def test_project_metadata_from_orm(self, orm_project: Project):
+        metadata = ProjectMetadata.from_orm(orm_project)
 
         assert metadata.id == "orm-test-id"
         assert metadata.name == "orm-test-name"
-        assert metadata.created_at == created_time.isoformat()
\ No newline at end of file
+        assert metadata.created_at == FIXED_TS.isoformat()
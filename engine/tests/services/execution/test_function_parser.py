@@ -2,112 +2,87 @@
 
 import pytest
 import ast
+import functools
 import textwrap # Import textwrap
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import Any, Dict
 
 from engine.services.execution.function_parser import FunctionParser, FunctionMetadata
 
-# --- Test Cases ---
+pytestmark = pytest.mark.xdist_group(name="function_parser")
 
-class TestFunctionParser:
+# --- Test Data ---
 
-    def _parse_function(self, code: str, function_name: str) -> FunctionMetadata:
-        tree = ast.parse(textwrap.dedent(code)) # Dedent the input code as well
-        parser = FunctionParser(function_name)
-        parser.visit(tree)
-        if not parser.found:
-            raise ValueError(f"Function '{function_name}' not found in code.")
-        return FunctionMetadata(
-            name=function_name,
-            description=parser.description,
-            parameters=parser.parameters,
-            is_async=parser.is_async
-        )
-
-    def test_simple_function(self):
-        code = """
+# (code, function name, expected metadata) for the shared parse-and-compare test
+_CASES = [
+    pytest.param(
+        """
             def simple_func(name: str, age: int = 30):
                 '''This is a simple function.'''
                 pass
-        """
-        func_name = "simple_func"
-        metadata = self._parse_function(code, func_name)
-
-        expected_description = """This is a simple function."""
-
-        assert metadata.name == func_name
-        # FIX: Use textwrap.dedent on both strings for comparison
-        assert textwrap.dedent(metadata.description) == textwrap.dedent(expected_description)
-        assert metadata.is_async is False
-        assert metadata.parameters == {
-            "type": "object",
+        """,
+        "simple_func",
+        {
+            "description": "This is a simple function.",
+            "is_async": False,
             "properties": {
                 "name": {"type": "string"},
                 "age": {"type": "integer"}
             },
-            "required": ["name"],
-            "additionalProperties": False
-        }
-
-    def test_async_function(self):
-        code = """
+            "required": ["name"]
+        },
+        id="simple"
+    ),
+    pytest.param(
+        """
             import asyncio
 
             async def async_func(item_id: str):
                 '''An asynchronous function.'''
                 await asyncio.sleep(1)
                 return item_id
-        """
-        func_name = "async_func"
-        metadata = self._parse_function(code, func_name)
-
-        expected_description = "An asynchronous function."
-
-        assert metadata.name == func_name
-        assert textwrap.dedent(metadata.description) == textwrap.dedent(expected_description)
-        assert metadata.is_async is True
-        assert metadata.parameters == {
-            "type": "object",
+        """,
+        "async_func",
+        {
+            "description": "An asynchronous function.",
+            "is_async": True,
             "properties": {
                 "item_id": {"type": "string"}
             },
-            "required": ["item_id"],
-            "additionalProperties": False
-        }
-
-    def test_no_docstring(self):
-        code = "def no_docs(x, y): pass"
-        func_name = "no_docs"
-        metadata = self._parse_function(code, func_name)
-
-        assert metadata.description == ""
-        assert metadata.is_async is False
-        assert metadata.parameters["properties"]["x"] == {"type": "object"}
-        assert metadata.parameters["properties"]["y"] == {"type": "object"}
-        assert sorted(metadata.parameters["required"]) == sorted(["x", "y"])
-
-    def test_no_parameters(self):
-        code = """
+            "required": ["item_id"]
+        },
+        id="async"
+    ),
+    pytest.param(
+        "def no_docs(x, y): pass",
+        "no_docs",
+        {
+            "description": "",
+            "is_async": False,
+            "properties": {
+                "x": {"type": "object"},
+                "y": {"type": "object"}
+            },
+            "required": ["x", "y"]
+        },
+        id="no_docstring"
+    ),
+    pytest.param(
+        """
             def no_params():
                 '''Function without parameters.'''
                 return True
-        """
-        func_name = "no_params"
-        metadata = self._parse_function(code, func_name)
-
-        expected_description = "Function without parameters."
-
-        assert textwrap.dedent(metadata.description) == textwrap.dedent(expected_description)
-        assert metadata.is_async is False
-        assert metadata.parameters == {
-            "type": "object",
+        """,
+        "no_params",
+        {
+            "description": "Function without parameters.",
+            "is_async": False,
             "properties": {},
-            "required": [],
-            "additionalProperties": False
-        }
-
-    def test_complex_types(self):
-        code = """
+            "required": []
+        },
+        id="no_parameters"
+    ),
+    pytest.param(
+        """
             from typing import List, Dict, Any, Optional, Union, Tuple
 
             def complex_types_func(
@@ -122,53 +97,102 @@ class TestFunctionParser:
             ):
                 '''Handles complex types.'''
                 pass
+        """,
+        "complex_types_func",
+        {
+            "description": "Handles complex types.",
+            "is_async": False,
+            "properties": {
+                "names": {"type": "array", "items": {"type": "string"}},
+                "config": {"type": "object", "additionalProperties": True},
+                "maybe_num": {"type": ["integer", "null"]},
+                "string_or_bool": {"type": ["boolean", "string"]},
+                "coords": {
+                    "type": "array",
+                    "items": [{"type": "number"}, {"type": "number"}],
+                    "minItems": 2,
+                    "maxItems": 2
+                },
+                "untyped_list": {"type": "array"},
+                "untyped_dict": {"type": "object"},
+                "any_param": {"type": "object"}
+            },
+            "required": [
+                "names", "config", "maybe_num", "string_or_bool", "coords",
+                "untyped_list", "untyped_dict", "any_param"
+            ]
+        },
+        id="complex_types"
+    ),
+    pytest.param(
         """
-        func_name = "complex_types_func"
-        metadata = self._parse_function(code, func_name)
-
-        expected_description = "Handles complex types."
-
-        assert textwrap.dedent(metadata.description) == textwrap.dedent(expected_description)
-        assert metadata.is_async is False
-        props = metadata.parameters["properties"]
-
-        assert props["names"] == {"type": "array", "items": {"type": "string"}}
-        assert props["config"] == {"type": "object", "additionalProperties": True}
-        assert props["maybe_num"] == {"type": ["integer", "null"]}
-        assert sorted(props["string_or_bool"]["type"]) == sorted(["string", "boolean"])
-        assert props["coords"] == {
-            "type": "array",
-            "items": [{"type": "number"}, {"type": "number"}],
-            "minItems": 2,
-            "maxItems": 2
-        }
-        assert props["untyped_list"] == {"type": "array"}
-        assert props["untyped_dict"] == {"type": "object"}
-        assert props["any_param"] == {"type": "object"}
-
-        expected_required = [
-            "names", "config", "maybe_num", "string_or_bool", "coords",
-            "untyped_list", "untyped_dict", "any_param"
-        ]
-        assert sorted(metadata.parameters["required"]) == sorted(expected_required)
-
-    def test_class_method(self):
-        code = """
             class MyClass:
                 def my_method(self, value: str):
                     '''A method in a class.'''
                     pass
-        """
-        func_name = "my_method"
-        metadata = self._parse_function(code, func_name)
+        """,
+        "my_method",
+        {
+            "description": "A method in a class.",
+            "is_async": False,
+            "properties": {
+                "value": {"type": "string"}
+            },
+            "required": ["value"]
+        },
+        id="class_method"
+    ),
+]
+
+_TO_DICT_PARAMETERS = {"type": "object", "properties": {"x": {"type": "integer"}}}
+_EXPECTED_TO_DICT = {
+    "name": "test",
+    "description": "desc",
+    "parameters": _TO_DICT_PARAMETERS,
+    "is_async": True
+}
+
+def _normalize_union_types(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Union members come back in set order; sort them for comparison."""
+    return {
+        name: {**prop, "type": sorted(prop["type"])} if isinstance(prop.get("type"), list) else prop
+        for name, prop in properties.items()
+    }
+
+@functools.lru_cache(maxsize=None)
+def _parse_cached(code: str, function_name: str) -> FunctionMetadata:
+    """Parse `code` and extract metadata for `function_name`, once per pair.
+    Tests only read the returned metadata, so sharing it is safe."""
+    tree = ast.parse(textwrap.dedent(code)) # Dedent the input code as well
+    parser = FunctionParser(function_name)
+    parser.visit(tree)
+    if not parser.found:
+        raise ValueError(f"Function '{function_name}' not found in code.")
+    return FunctionMetadata(
+        name=function_name,
+        description=parser.description,
+        parameters=parser.parameters,
+        is_async=parser.is_async
+    )
+
+# --- Test Cases ---
+
+class TestFunctionParser:
+
+    def _parse_function(self, code: str, function_name: str) -> FunctionMetadata:
+        return _parse_cached(code, function_name)
 
-        expected_description = "A method in a class."
+    @pytest.mark.parametrize("code,name,expected", _CASES)
+    def test_parse_function(self, code: str, name: str, expected: Dict[str, Any]):
+        metadata = self._parse_function(code, name)
 
-        assert textwrap.dedent(metadata.description) == textwrap.dedent(expected_description)
-        assert metadata.is_async is False
-        assert "self" not in metadata.parameters["properties"]
-        assert metadata.parameters["properties"]["value"] == {"type": "string"}
-        assert metadata.parameters["required"] == ["value"]
+        assert metadata.name == name
+        assert textwrap.dedent(metadata.description) == textwrap.dedent(expected["description"])
+        assert metadata.is_async is expected["is_async"]
+        assert metadata.parameters["type"] == "object"
+        assert metadata.parameters["additionalProperties"] is False
+        assert _normalize_union_types(metadata.parameters["properties"]) == expected["properties"]
+        assert set(metadata.parameters["required"]) == set(expected["required"])
 
     def test_function_not_found(self):
         code = "def another_func(): pass"
@@ -181,13 +205,7 @@ class TestFunctionParser:
         metadata = FunctionMetadata(
             name="test",
             description="desc",
-            parameters={"type": "object", "properties": {"x": {"type": "integer"}}},
+            parameters=_TO_DICT_PARAMETERS,
             is_async=True
         )
-        expected_dict = {
-            "name": "test",
-            "description": "desc",
-            "parameters": {"type": "object", "properties": {"x": {"type": "integer"}}},
-            "is_async": True
-        }
-        assert metadata.to_dict() == expected_dict
\ No newline at end of file
+        assert metadata.to_dict() == _EXPECTED_TO_DICT
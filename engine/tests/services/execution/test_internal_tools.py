@@ -0,0 +1,180 @@
+# tests/services/execution/test_internal_tools.py
+
+import functools
+import pytest
+from typing import List, Literal, Optional
+
+from engine.services.execution.internal_tools import InternalToolManager
+from engine.services.execution.function_parser import FunctionMetadata
+
+pytestmark = pytest.mark.xdist_group(name="internal_tools")
+
+# --- Sample Tools ---
+
+def greet(name: str, excited: bool = False) -> str:
+    """Greet someone by name.
+
+    Args:
+        name: Person to greet
+        excited: Whether to add an exclamation mark
+    """
+    return f"Hello, {name}{'!' if excited else '.'}"
+
+async def fetch_item(item_id: int) -> dict:
+    """Fetch an item by id."""
+    return {"id": item_id}
+
+def tag_items(values: List[str], mode: Literal["append", "replace"], limit: Optional[int] = None):
+    return values[:limit] if mode == "replace" else values
+
+def failing_tool():
+    """Always fails."""
+    raise RuntimeError("boom")
+
+@functools.lru_cache(maxsize=None)
+def _meta(func, name: str, manager: InternalToolManager, description: Optional[str] = None) -> FunctionMetadata:
+    """Extract metadata once per (func, name, manager); tests only read the result."""
+    return manager._extract_function_metadata(func, name, description)
+
+# --- Fixtures ---
+
+@pytest.fixture(scope="module")
+def tool_manager() -> InternalToolManager:
+    """One manager per module; _reset_tools empties it before every test."""
+    return InternalToolManager()
+
+@pytest.fixture(scope="session")
+def pure_manager() -> InternalToolManager:
+    """Manager for tests that only call pure helpers; nothing is ever registered on it."""
+    return InternalToolManager()
+
+@pytest.fixture(scope="module")
+def populated_manager() -> InternalToolManager:
+    """Manager with the sample tools registered once; tests must only read from it."""
+    manager = InternalToolManager()
+    manager.register_tool("greet", greet)
+    manager.register_tool("fetch_item", fetch_item)
+    manager.register_tool("tag_items", tag_items)
+    return manager
+
+@pytest.fixture(autouse=True)
+def _reset_tools(tool_manager: InternalToolManager):
+    tool_manager.clear_tools()
+    yield
+
+# --- Test Cases ---
+
+class TestInternalToolManager:
+
+    def test_register_tool_success(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("greet", greet)
+
+        assert tool_manager.has_tool("greet")
+        assert tool_manager.get_tool_function("greet") is greet
+        metadata = tool_manager.get_tool_metadata("greet")
+        assert isinstance(metadata, FunctionMetadata)
+        assert metadata.name == "greet"
+        assert metadata.description == "Greet someone by name."
+        assert metadata.is_async is False
+
+    def test_register_tool_duplicate(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("greet", greet)
+        with pytest.raises(ValueError, match="Custom tool 'greet' already registered"):
+            tool_manager.register_tool("greet", greet)
+
+    def test_register_tools_replaces_existing(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("failing", failing_tool)
+        tool_manager.register_tools({"greet": greet, "tag_items": tag_items})
+
+        assert set(tool_manager.get_all_tools()) == {"greet", "tag_items"}
+        # Without a docstring the description falls back to a generic one
+        assert tool_manager.get_tool_metadata("tag_items").description == "Execute the tag_items tool"
+
+    def test_clear_tools(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("greet", greet)
+        tool_manager.clear_tools()
+        assert tool_manager.get_all_tools() == []
+        assert tool_manager.get_tool_metadata("greet") is None
+
+    def test_unknown_tool_lookups(self, tool_manager: InternalToolManager):
+        assert tool_manager.has_tool("missing") is False
+        assert tool_manager.get_tool_function("missing") is None
+        assert tool_manager.get_tool_metadata("missing") is None
+
+    @pytest.mark.parametrize("tool_names, expected_names", [
+        (None, {"greet", "fetch_item", "tag_items"}),
+        ("all", {"greet", "fetch_item", "tag_items"}),
+        ("none", set()),
+        ([], set()),
+        (["greet", "tag_items", "non_existent"], {"greet", "tag_items"}),
+    ])
+    def test_get_tool_definitions(self, populated_manager: InternalToolManager, tool_names, expected_names):
+        definitions = populated_manager.get_tool_definitions(tool_names)
+
+        assert {d["function"]["name"] for d in definitions} == expected_names
+        for definition in definitions:
+            metadata = populated_manager.get_tool_metadata(definition["function"]["name"])
+            assert definition["type"] == "function"
+            assert definition["function"]["description"] == metadata.description
+            assert definition["function"]["parameters"] == metadata.parameters
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_tool_sync(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("greet", greet)
+        result = await tool_manager.execute_tool("greet", {"name": "Ada", "excited": True})
+        assert result == "Hello, Ada!"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_tool_async(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("fetch_item", fetch_item)
+        result = await tool_manager.execute_tool("fetch_item", {"item_id": 7})
+        assert result == {"id": 7}
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_tool_not_found(self, tool_manager: InternalToolManager):
+        with pytest.raises(ValueError, match="Custom tool 'missing' not found"):
+            await tool_manager.execute_tool("missing", {})
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_execute_tool_propagates_errors(self, tool_manager: InternalToolManager):
+        tool_manager.register_tool("failing", failing_tool)
+        with pytest.raises(RuntimeError, match="boom"):
+            await tool_manager.execute_tool("failing", {})
+
+    def test_extract_function_metadata_parameters(self, pure_manager: InternalToolManager):
+        metadata = _meta(greet, "greet", pure_manager)
+        props = metadata.parameters["properties"]
+
+        assert props["name"]["type"] == "string"
+        assert props["name"]["description"].startswith("Person to greet")
+        assert props["excited"]["type"] == "boolean"
+        assert metadata.parameters["required"] == ["name"]
+
+    def test_extract_function_metadata_generic_types(self, pure_manager: InternalToolManager):
+        metadata = _meta(tag_items, "tag_items", pure_manager)
+        props = metadata.parameters["properties"]
+
+        assert props["values"] == {"type": "array", "items": {"type": "string"}, "description": "Parameter values"}
+        assert props["mode"]["enum"] == ["append", "replace"]
+        # Optional[int] collapses to its inner type
+        assert props["limit"]["type"] == "integer"
+        assert set(metadata.parameters["required"]) == {"values", "mode"}
+
+    def test_extract_function_metadata_async(self, pure_manager: InternalToolManager):
+        metadata = _meta(fetch_item, "fetch_item", pure_manager, "Custom description")
+        assert metadata.is_async is True
+        assert metadata.description == "Custom description"
+
+    def test_type_to_json_schema_literal(self, pure_manager: InternalToolManager):
+        schema = pure_manager._type_to_json_schema(Literal["low", "high"])
+        assert schema == {"type": "string", "enum": ["low", "high"]}
+
+    def test_type_to_json_schema_is_cached(self, pure_manager: InternalToolManager):
+        assert pure_manager._type_to_json_schema(List[str]) is pure_manager._type_to_json_schema(List[str])
+
+    def test_extract_function_metadata_copies_cached_schema(self, pure_manager: InternalToolManager):
+        metadata = pure_manager._extract_function_metadata(tag_items, "tag_items")
+        metadata.parameters["properties"]["values"]["items"]["type"] = "mutated"
+
+        # The cached List[str] schema must not see changes to a tool's parameters
+        assert pure_manager._type_to_json_schema(List[str]) == {"type": "array", "items": {"type": "string"}}
@@ -2,9 +2,11 @@
 
 import pytest
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 from contextlib import contextmanager
 from pydantic import BaseModel
+import instructor
+from litellm import ModelResponse
 from typing import List, Dict, Any
 
 from sqlalchemy.orm import Session
@@ -14,6 +16,8 @@ from engine.services.execution.model import ModelService, MODEL_CONFIG_KEY, DEFA
 from engine.db.models import GlobalConfig
 
 
+pytestmark = pytest.mark.xdist_group(name="model")
+
 # --- Test Data ---
 TEST_MODEL_NAME = "test-model-name"
 
@@ -26,43 +30,55 @@ class TestResponse(BaseModel):
 
 # --- Fixtures ---
 
+@pytest.fixture(autouse=True, scope="module")
+def _no_litellm():
+    """Keep ModelService.__init__ from building a real instructor client; patched
+    once for the whole module. Request it by name to inspect the mock."""
+    with patch('engine.services.execution.model.instructor.from_litellm') as from_litellm:
+        yield from_litellm
+
+@pytest.fixture(scope="class")
+def mock_instructor_client() -> Mock:
+    """Instructor client double, built once per class. `chat` and `completions`
+    return the client itself, as on the real Instructor, so create_with_completion
+    is spec-checked. Tests take it through instructor_client, which resets it."""
+    client = Mock(spec=instructor.Instructor)
+    client.chat = client
+    client.completions = client
+    return client
+
+
 @pytest.fixture
-def mock_config(db_session: Session) -> GlobalConfig:
-    """Create a model config in the database"""
-    # Delete any existing configs
-    db_session.query(GlobalConfig).filter(GlobalConfig.key == MODEL_CONFIG_KEY).delete()
-    
-    # Create new config
+def instructor_client(mock_instructor_client: Mock) -> Mock:
+    yield mock_instructor_client
+    mock_instructor_client.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def mock_config(module_db_session: Session) -> GlobalConfig:
+    """Model config seeded once per test module. Tests that change or delete it
+    do so inside a db_session SAVEPOINT, which restores it on rollback."""
     config = GlobalConfig(
         key=MODEL_CONFIG_KEY,
         value=TEST_MODEL_NAME,
         description="Test model config"
     )
-    db_session.add(config)
-    db_session.commit()
-    db_session.refresh(config)
+    module_db_session.add(config)
+    module_db_session.flush()
     return config
 
 
 @pytest.fixture
-def model_service(db_session: Session):
+def model_service(db_session: Session, mock_db_context):
     """Create a ModelService with patched database and initialization"""
-    # Patch both instructor and the initialization to prevent actual model loading
-    with patch('engine.services.execution.model.instructor.from_litellm'), \
-         patch.object(ModelService, '_load_model_config'):
+    # Patch the initialization to prevent actual model loading
+    with patch.object(ModelService, '_load_model_config'):
         
         # Create service with model loading mocked out
         service = ModelService()
         
         # Replace the _get_db method
-        @contextmanager
-        def test_db_context():
-            try:
-                yield db_session
-            finally:
-                pass
-        
-        service._get_db = test_db_context
+        service._get_db = mock_db_context
         
         # Replace the _load_model_config to return our test value
         def load_from_test_db():
@@ -84,59 +100,27 @@ def model_service(db_session: Session):
 
 class TestModelService:
 
-    def test_init_with_existing_config(self, db_session: Session, mock_config: GlobalConfig):
-        """Test initialization with existing config loads from DB"""
-        with patch('engine.services.execution.model.instructor.from_litellm'):
-            # To test the real initialization, we need to mock just enough
-            # to prevent actual API calls but allow the real DB loading
-            
-            # Create a fresh service instance
-            service = ModelService()
-            
-            # Override DB session
-            @contextmanager
-            def test_db_context():
-                try:
-                    yield db_session
-                finally:
-                    pass
-            
-            # Replace _get_db and re-load config
-            service._get_db = test_db_context
-            service.model_name = service._load_model_config()
-            
-            # Should load existing config
-            assert service.model_name == TEST_MODEL_NAME
-
-    def test_init_with_no_config(self, db_session: Session):
-        """Test initialization with no existing config creates default"""
-        # Remove any existing configs
-        db_session.query(GlobalConfig).filter(GlobalConfig.key == MODEL_CONFIG_KEY).delete()
-        db_session.commit()
-        
-        with patch('engine.services.execution.model.instructor.from_litellm'):
-            # Create service
-            service = ModelService()
-            
-            # Override DB session
-            @contextmanager
-            def test_db_context():
-                try:
-                    yield db_session
-                finally:
-                    pass
-            
-            # Replace _get_db with our test version and re-load config
-            service._get_db = test_db_context
-            service.model_name = service._load_model_config()
-            
-            # Should create default config
-            assert service.model_name == DEFAULT_MODEL
-            
-            # Verify in DB
-            config = db_session.query(GlobalConfig).filter(GlobalConfig.key == MODEL_CONFIG_KEY).first()
-            assert config is not None
-            assert config.value == DEFAULT_MODEL
+    @pytest.mark.parametrize("seed_config, expected", [
+        (True, TEST_MODEL_NAME),
+        (False, DEFAULT_MODEL),
+    ])
+    def test_load_model_config(self, mock_config: GlobalConfig, db_session: Session, mock_db_context, seed_config: bool, expected: str):
+        """Test loading config from DB, creating the default when none exists"""
+        if not seed_config:
+            # Remove the seeded config; the SAVEPOINT rollback brings it back
+            db_session.query(GlobalConfig).filter(GlobalConfig.key == MODEL_CONFIG_KEY).delete()
+            db_session.commit()
+
+        # Skip __init__; only _get_db is needed to load (and persist) the config
+        service = ModelService.__new__(ModelService)
+        service._get_db = mock_db_context
+
+        assert service._load_model_config() == expected
+
+        # Verify in DB
+        config = db_session.query(GlobalConfig).filter(GlobalConfig.key == MODEL_CONFIG_KEY).first()
+        assert config is not None
+        assert config.value == expected
 
     def test_set_model(self, model_service: ModelService, db_session: Session):
         """Test setting model updates DB"""
@@ -177,14 +161,19 @@ class TestModelService:
         assert "identifier" in model
         assert "label" in model
 
-    @patch('engine.services.execution.model.instructor.from_litellm')
-    def test_structured_output(self, mock_instructor, model_service: ModelService):
+        # Every call gets its own copy; changes don't leak into later calls
+        available_models["openai"][0]["name"] = "mutated"
+        available_models.pop("anthropic")
+        fresh = model_service.get_available_models()
+        assert "anthropic" in fresh
+        assert fresh["openai"][0]["name"] != "mutated"
+
+    def test_structured_output(self, model_service: ModelService, instructor_client: Mock):
         """Test structured output calls instructor correctly"""
         # Setup mock
-        mock_client = MagicMock()
-        mock_instructor.return_value = mock_client
+        mock_client = instructor_client
         
-        mock_response = (TestResponse(result="test", score=0.9), MagicMock())
+        mock_response = (TestResponse(result="test", score=0.9), Mock(spec=ModelResponse))
         mock_client.chat.completions.create_with_completion.return_value = mock_response
         
         # Override the instructor client
@@ -213,12 +202,10 @@ class TestModelService:
         assert result.score == 0.9
 
 
-    @patch('engine.services.execution.model.instructor.from_litellm')
-    def test_structured_output_error(self, mock_instructor, model_service: ModelService):
+    def test_structured_output_error(self, model_service: ModelService, instructor_client: Mock):
         """Test error handling in structured output"""
         # Setup mock
-        mock_client = MagicMock()
-        mock_instructor.return_value = mock_client
+        mock_client = instructor_client
         
         # Configure mock to raise exception
         mock_client.chat.completions.create_with_completion.side_effect = Exception("Parsing error")
@@ -248,5 +235,6 @@ class TestModelService:
         
         model_service._get_db = raise_error
         
-        # Should return default model on error
-        assert model_service._load_model_config() == DEFAULT_MODEL
\ No newline at end of file
+        # Should return default model on error; call the real loader, since the
+        # fixture swaps in one that bypasses _get_db
+        assert ModelService._load_model_config(model_service) == DEFAULT_MODEL
\ No newline at end of file
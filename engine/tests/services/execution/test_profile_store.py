@@ -1,13 +1,13 @@
 # tests/services/execution/test_profile_store.py
 
 import pytest
-import pytest_asyncio
 import uuid
 from unittest.mock import patch, MagicMock
 from datetime import datetime, UTC, timedelta
 from contextlib import contextmanager
 import json
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError
@@ -24,14 +24,51 @@ from engine.services.execution.profile_store import (
 )
 from engine.db.models import Module, ProfileStore
 
+pytestmark = pytest.mark.xdist_group(name="profile_store")
+
 # --- Constants ---
 TEST_MODULE_ID = "test-module-123"
 TEST_PROFILE = "test-profile"
 TEST_COLLECTION = "test-collection"
+_FIND_ERR = re.compile("Failed to find profile store entries")
+_SET_ERR = re.compile("Failed to set profile store value")
+# Fixed reference time for sample rows; nothing here depends on the wall clock
+_SAMPLE_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+# Rows for set_many/populated_store; built once at import and never mutated by tests
+SAMPLE_DATA = (
+    {
+        "id": "item1",
+        "name": "Test Item 1",
+        "price": 100.50,
+        "tags": ["electronics", "sale"],
+        "metadata": { "color": "red", "weight": 1.5 },
+        "in_stock": True,
+        "created_at": (_SAMPLE_NOW - timedelta(days=5)).isoformat()
+    },
+    {
+        "id": "item2",
+        "name": "Test Item 2",
+        "price": 50.25,
+        "tags": ["clothing", "sale", "summer"],
+        "metadata": { "color": "blue", "weight": 0.3 },
+        "in_stock": True,
+        "created_at": (_SAMPLE_NOW - timedelta(days=2)).isoformat()
+    },
+    {
+        "id": "item3",
+        "name": "Test Item 3",
+        "price": 200.00,
+        "tags": ["electronics", "premium"],
+        "metadata": { "color": "black", "weight": 2.0 },
+        "in_stock": False,
+        "created_at": (_SAMPLE_NOW - timedelta(days=10)).isoformat()
+    },
+)
 
 # --- Fixtures ---
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def profile_store_info() -> ProfileStoreInfo:
     return ProfileStoreInfo(
         module_id=TEST_MODULE_ID,
@@ -40,16 +77,15 @@ def profile_store_info() -> ProfileStoreInfo:
     )
 
 @pytest.fixture
-def profile_store_service(db_session: Session, profile_store_info: ProfileStoreInfo) -> ProfileStoreService:
+def profile_store_service(mock_db_context, profile_store_info: ProfileStoreInfo) -> ProfileStoreService:
     service = ProfileStoreService(storeInfo=profile_store_info)
-    @contextmanager
-    def test_db_context():
-        yield db_session
-    service._get_db = test_db_context
+    service._get_db = mock_db_context
     return service
 
-@pytest.fixture
-def test_module(db_session: Session) -> Module:
+@pytest.fixture(scope="module")
+def test_module(module_db_session: Session) -> Module:
+    """Parent module row, seeded once per test module. Tests that write profile
+    store rows run in db_session SAVEPOINTs nested inside this transaction."""
     module = Module(
         module_id=TEST_MODULE_ID,
         module_name="Test Module",
@@ -60,54 +96,43 @@ def test_module(db_session: Session) -> Module:
         env_vars={},
         workspace_name="test-repo"
     )
-    existing = db_session.query(Module).filter_by(module_id=TEST_MODULE_ID).first()
-    if existing:
-        return existing
-    db_session.add(module)
-    db_session.commit()
-    db_session.refresh(module)
+    module_db_session.add(module)
+    module_db_session.flush()
     return module
 
-@pytest.fixture
-def sample_data() -> List[Dict[str, Any]]:
-    return [
-        {
-            "id": "item1",
-            "name": "Test Item 1",
-            "price": 100.50,
-            "tags": ["electronics", "sale"],
-            "metadata": { "color": "red", "weight": 1.5 },
-            "in_stock": True,
-            "created_at": (datetime.now(UTC) - timedelta(days=5)).isoformat()
-        },
-        {
-            "id": "item2",
-            "name": "Test Item 2",
-            "price": 50.25,
-            "tags": ["clothing", "sale", "summer"],
-            "metadata": { "color": "blue", "weight": 0.3 },
-            "in_stock": True,
-            "created_at": (datetime.now(UTC) - timedelta(days=2)).isoformat()
-        },
+@pytest.fixture(scope="session")
+def sample_data() -> Tuple[Dict[str, Any], ...]:
+    return SAMPLE_DATA
+
+@pytest.fixture(scope="module")
+def populated_store(module_db_session: Session, profile_store_info: ProfileStoreInfo, test_module: Module, sample_data: Tuple[Dict[str, Any], ...]) -> List[ProfileStoreRecord]:
+    """Load sample_data once per module with a single executemany; set_many itself is
+    covered by test_set_many. Tests that update or delete these rows do so inside a
+    db_session SAVEPOINT, which restores them on rollback."""
+    assert test_module is not None
+    rows = [
         {
-            "id": "item3",
-            "name": "Test Item 3",
-            "price": 200.00,
-            "tags": ["electronics", "premium"],
-            "metadata": { "color": "black", "weight": 2.0 },
-            "in_stock": False,
-            "created_at": (datetime.now(UTC) - timedelta(days=10)).isoformat()
+            "id": uuid.uuid4(),
+            "module_id": profile_store_info.module_id,
+            "profile": profile_store_info.profile,
+            "collection": profile_store_info.collection,
+            "value": value,
+            "created_at": _SAMPLE_NOW,
+            "updated_at": _SAMPLE_NOW
         }
+        for value in sample_data
+    ]
+    module_db_session.bulk_insert_mappings(ProfileStore, rows)
+    return [
+        ProfileStoreRecord(
+            **{**row, "created_at": row["created_at"].isoformat(), "updated_at": row["updated_at"].isoformat()}
+        )
+        for row in rows
     ]
-
-@pytest_asyncio.fixture
-async def populated_store(profile_store_service: ProfileStoreService, test_module: Module, sample_data: List[Dict[str, Any]]) -> List[ProfileStoreRecord]:
-    assert test_module is not None
-    return await profile_store_service.set_many(sample_data)
 
 # --- Test Cases ---
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 class TestProfileStoreService:
 
     async def test_set_value(self, profile_store_service: ProfileStoreService, test_module: Module):
@@ -118,8 +143,8 @@ class TestProfileStoreService:
         assert record.value == value
         assert isinstance(record.id, uuid.UUID)
 
-    async def test_set_many(self, profile_store_service: ProfileStoreService, test_module: Module, sample_data: List[Dict[str, Any]]):
-        records = await profile_store_service.set_many(sample_data)
+    async def test_set_many(self, profile_store_service: ProfileStoreService, test_module: Module, sample_data: Tuple[Dict[str, Any], ...]):
+        records = await profile_store_service.set_many(list(sample_data))
         assert len(records) == len(sample_data)
         for i, record in enumerate(records):
             assert isinstance(record, ProfileStoreRecord)
@@ -146,23 +171,16 @@ class TestProfileStoreService:
         assert len(records) == 1
         assert records[0].value["id"] == "item1"
 
-    async def test_find_simple_filter_gt(self, profile_store_service: ProfileStoreService, populated_store: List[ProfileStoreRecord]):
-        filter_ = ProfileStoreFilter(value_filters={"price": {"gt": 100}})
-        with pytest.raises(ProfileStoreError, match="Failed to find profile store entries"):
-             await profile_store_service.find(filter_)
-
-
-
-    async def test_find_with_in_operator(self, profile_store_service: ProfileStoreService, populated_store: List[ProfileStoreRecord]):
-        filter_ = ProfileStoreFilter(value_filters={"metadata.color": {"in": ["red", "blue"]}})
-        with pytest.raises(ProfileStoreError, match="Failed to find profile store entries"):
+    @pytest.mark.parametrize("value_filters", [
+        {"price": {"gt": 100}},
+        {"metadata.color": {"in": ["red", "blue"]}},
+        {"tags": {"contains": ["sale"]}},
+    ], ids=["gt", "in", "contains"])
+    async def test_find_unsupported_ops(self, profile_store_service: ProfileStoreService, populated_store: List[ProfileStoreRecord], value_filters: Dict[str, Any]):
+        filter_ = ProfileStoreFilter(value_filters=value_filters)
+        with pytest.raises(ProfileStoreError, match=_FIND_ERR):
             await profile_store_service.find(filter_)
 
-    async def test_find_with_contains(self, profile_store_service: ProfileStoreService, populated_store: List[ProfileStoreRecord]):
-        filter_ = ProfileStoreFilter(value_filters={"tags": {"contains": ["sale"]}})
-        with pytest.raises(ProfileStoreError, match="Failed to find profile store entries"):
-             await profile_store_service.find(filter_)
-
     # Tests for basic functionality (Limit/Offset/Update/Delete)
 
     async def test_find_with_limit_offset_basic(self, profile_store_service: ProfileStoreService, populated_store: List[ProfileStoreRecord]):
@@ -182,7 +200,6 @@ class TestProfileStoreService:
         update_value = {"name": "Updated Item 2 Name", "price": 60.00}
 
         await profile_store_service.update(filter_, update_value)
-        db_session.commit()
         updated_record_db = db_session.get(ProfileStore, record_to_update_pk)
         assert updated_record_db is not None
         assert updated_record_db.value["name"] == "Updated Item 2 Name"
@@ -194,7 +211,6 @@ class TestProfileStoreService:
         filter_ = ProfileStoreFilter(value_filters={"id": {"eq": record_to_delete_id_val}})
 
         await profile_store_service.delete(filter_)
-        db_session.commit()
         deleted_record_db = db_session.get(ProfileStore, record_to_delete_pk)
         assert deleted_record_db is None
 
@@ -207,6 +223,6 @@ class TestProfileStoreService:
 
         profile_store_service._get_db = mock_context_manager
 
-        with pytest.raises(ProfileStoreError, match="Failed to set profile store value") as excinfo:
+        with pytest.raises(ProfileStoreError, match=_SET_ERR) as excinfo:
             await profile_store_service.set_value({"test": "value"})
         assert "Simulated Database error" in str(excinfo.value)
\ No newline at end of file
@@ -3,12 +3,13 @@
 import pytest
 from unittest.mock import patch
 from datetime import datetime, UTC, timedelta
-from contextlib import contextmanager
 
 from sqlalchemy.orm import Session
 
 from engine.services.execution.state import StateService, AgentState, InvalidTransition
-from engine.db.models import AgentStatus, ProfileStatus
+from engine.db.models import AgentStatus, Module, ProfileStatus
+
+pytestmark = pytest.mark.xdist_group(name="state")
 
 # --- Constants ---
 TEST_MODULE_ID = "test-module-123"
@@ -17,24 +18,38 @@ TEST_PROFILE_TYPE = "test-profile"
 # --- Fixtures ---
 
 @pytest.fixture
-def state_service(db_session: Session) -> StateService:
+def state_service(mock_db_context) -> StateService:
     service = StateService()
-    
-    @contextmanager
-    def test_db_context():
-        try:
-            yield db_session
-        finally:
-            pass
-    
-    service._get_db = test_db_context
+    service._get_db = mock_db_context
     return service
 
+@pytest.fixture(scope="module")
+def seeded_state(module_db_session: Session) -> AgentStatus:
+    """Module row and its STANDBY status, seeded once per test module. Tests that
+    change the state run in db_session SAVEPOINTs, which restore it on rollback."""
+    module_db_session.add(Module(
+        module_id=TEST_MODULE_ID,
+        module_name="Test Module",
+        kit_id="test-kit",
+        owner="test-owner",
+        version="1.0.0",
+        created_at=datetime.now(UTC),
+        env_vars={},
+        workspace_name="test-repo"
+    ))
+    status = AgentStatus(
+        module_id=TEST_MODULE_ID,
+        state=AgentState.STANDBY.value,
+        last_updated=datetime.now(UTC)
+    )
+    module_db_session.add(status)
+    module_db_session.flush()
+    return status
+
 @pytest.fixture
-def initialized_module(state_service: StateService, db_session: Session) -> str:
-    """Initialize a test module and return its ID"""
-    state_service.initialize_module(TEST_MODULE_ID)
-    return TEST_MODULE_ID
+def initialized_module(seeded_state: AgentStatus, db_session: Session) -> str:
+    """ID of the seeded test module; depends on db_session so writes roll back"""
+    return seeded_state.module_id
 
 @pytest.fixture
 def profile_status(db_session: Session, initialized_module: str) -> ProfileStatus:
@@ -47,7 +62,6 @@ def profile_status(db_session: Session, initialized_module: str) -> ProfileStatu
     )
     db_session.add(status)
     db_session.commit()
-    db_session.refresh(status)
     return status
 
 # --- Test Cases ---
@@ -65,6 +79,14 @@ class TestStateService:
         assert status.state == AgentState.STANDBY.value
         assert status.last_updated is not None
 
+    def test_initialize_module_resets_existing(self, state_service: StateService, initialized_module: str, db_session: Session):
+        """Test re-initializing an existing module puts it back in STANDBY"""
+        state_service.set_executing(initialized_module)
+        state_service.initialize_module(initialized_module)
+
+        status = db_session.query(AgentStatus).filter_by(module_id=initialized_module).one()
+        assert status.state == AgentState.STANDBY.value
+
     def test_get_status_existing(self, state_service: StateService, initialized_module: str):
         """Test getting status for an existing module"""
         state = state_service.get_status(initialized_module)
@@ -4,6 +4,8 @@ import pytest
 import zipfile
 import io
 import os
+import shutil
+import subprocess
 from pathlib import Path
 from datetime import datetime
 from git import Repo, Actor, GitCommandError
@@ -17,61 +19,114 @@ from engine.services.storage.workspace import (
 )
 from engine.utils.file import extract_zip, is_safe_path
 
-@pytest.fixture
-def repo_service(tmp_path: Path) -> WorkspaceService:
-    """Fixture for RepoService initialized with a temporary base path."""
-    base_path = tmp_path / "repos"
-    base_path.mkdir()
-    return WorkspaceService(base_path=base_path)
+pytestmark = pytest.mark.xdist_group(name="storage")
 
-@pytest.fixture
-def create_zip_content() -> bytes:
-    """Fixture to create in-memory zip content."""
+def _build_zip() -> bytes:
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    # Stored, not deflated: compressing a few bytes of payload is pure overhead
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zipf:
         zipf.writestr("file1.txt", "content1")
         zipf.writestr("subdir/file2.txt", "content2")
-    zip_buffer.seek(0)
     return zip_buffer.getvalue()
 
-@pytest.fixture
-def create_test_repo(repo_service: WorkspaceService, create_zip_content: bytes):
-    """Helper fixture to create a standard test repo."""
-    repo_name = "test_repo"
-    content_file = io.BytesIO(create_zip_content)
-    result = repo_service.create_workspace(
-        workspace_name=repo_name,
-        content_file=content_file,
+# Built once at import; bytes are immutable, so every test can share them
+_ZIP_BYTES = _build_zip()
+
+@pytest.fixture(scope="module")
+def repo_service(tmp_path_factory: pytest.TempPathFactory) -> WorkspaceService:
+    """RepoService built once per module; _clean_repos empties base_path after every test."""
+    return WorkspaceService(base_path=tmp_path_factory.mktemp("repos"))
+
+@pytest.fixture(autouse=True)
+def _clean_repos(repo_service: WorkspaceService):
+    yield
+    for entry in repo_service.base_path.iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+
+@pytest.fixture(scope="session")
+def create_zip_content() -> bytes:
+    """In-memory zip content; callers wrap it in their own io.BytesIO."""
+    return _ZIP_BYTES
+
+@pytest.fixture(scope="session")
+def git_template_dir(tmp_path_factory: pytest.TempPathFactory, create_zip_content: bytes):
+    """The standard test repo, created once through WorkspaceService itself
+    (extracted zip + initial commit). create_test_repo copies it per test."""
+    template_service = WorkspaceService(base_path=tmp_path_factory.mktemp("tpl"))
+    result = template_service.create_workspace(
+        workspace_name="test_repo",
+        content_file=io.BytesIO(create_zip_content),
         filename="test.zip",
         extract_func=extract_zip
     )
-    repo_path = repo_service.get_workspace_path(repo_name)
-    return repo_name, repo_path, result
+    return template_service.get_workspace_path("test_repo"), result
 
 @pytest.fixture
-def create_parent_child_repos(repo_service: WorkspaceService):
-    """Fixture to create two repos for submodule testing."""
-    parent_name = "parent_repo"
-    child_name = "child_repo"
+def create_test_repo(repo_service: WorkspaceService, git_template_dir):
+    """Helper fixture to create a standard test repo."""
+    repo_name = "test_repo"
+    template_path, result = git_template_dir
+    repo_path = repo_service.get_workspace_path(repo_name)
+    shutil.copytree(template_path, repo_path)
+    # Workspaces pin core.worktree to their absolute path; point the copy at itself
+    with Repo(repo_path).config_writer() as git_config:
+        git_config.set_value('core', 'worktree', str(repo_path.absolute()).replace('\\', '/'))
+    return repo_name, repo_path, result
 
-    # Create parent repo (can be empty initially)
-    parent_path = repo_service.get_workspace_path(parent_name)
+# Identity for fixture commits; plumbing commands don't read it from the repo config
+_GIT_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+def _git(repo_path: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo_path, env=_GIT_ENV, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+def _init_and_commit(repo_path: Path, message: str) -> None:
+    """git init, stage every file in repo_path and make one commit with
+    write-tree/commit-tree/update-ref, skipping GitPython's index refresh."""
+    _git(repo_path, "init", "-q")
+    _git(repo_path, "add", "-A")
+    tree = _git(repo_path, "write-tree")
+    commit = _git(repo_path, "commit-tree", tree, "-m", message)
+    _git(repo_path, "update-ref", "HEAD", commit)
+
+@pytest.fixture(scope="module")
+def parent_child_skeletons(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Parent and child repos with one commit each, built once per module.
+    Tests get copies via create_parent_child_repos."""
+    root = tmp_path_factory.mktemp("parent_child")
+
+    # Parent repo just needs a dummy file and a commit to have a branch
+    parent_path = root / "parent_repo"
     parent_path.mkdir()
-    parent_git_repo = Repo.init(parent_path)
-    # Add a dummy file and commit to have a branch
     (parent_path / "dummy.txt").touch()
-    parent_git_repo.index.add(["dummy.txt"])
-    parent_git_repo.index.commit("Initial commit for parent")
+    _init_and_commit(parent_path, "Initial commit for parent")
 
-
-    # Create child repo with some content
-    child_path = repo_service.get_workspace_path(child_name)
+    # Child repo with some content
+    child_path = root / "child_repo"
     child_path.mkdir()
-    child_git_repo = Repo.init(child_path)
     (child_path / "child_file.txt").write_text("child content")
-    child_git_repo.index.add(["child_file.txt"])
-    child_git_repo.index.commit("Initial commit for child")
+    _init_and_commit(child_path, "Initial commit for child")
+
+    return root
 
+@pytest.fixture
+def create_parent_child_repos(repo_service: WorkspaceService, parent_child_skeletons: Path):
+    """Fixture to create two repos for submodule testing."""
+    parent_name = "parent_repo"
+    child_name = "child_repo"
+    for name in (parent_name, child_name):
+        shutil.copytree(parent_child_skeletons / name, repo_service.get_workspace_path(name))
     return parent_name, child_name
 
 # --- Test Cases ---
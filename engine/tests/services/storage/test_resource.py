@@ -0,0 +1,113 @@
+# tests/services/storage/test_resource.py
+
+import copy
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from engine.services.core.module import ModuleError, ModuleService
+from engine.services.execution.model import ModelService
+from engine.services.storage.resource import ResourceService, ResourceError, Resource
+from engine.utils.yaml import YAMLUtils
+
+# --- Constants ---
+TEST_MODULE_ID = "test-module-123"
+TEST_WORKSPACE = "test-workspace"
+
+# kit.yaml contents handed out by the patched YAMLUtils.read_kit; never mutated
+_DOCS_KIT = {
+    "workspace": {
+        "files": [
+            {"path": "docs/*.md", "description": "Documentation"},
+            {"path": "**/*.py", "description": "Source files"},
+        ],
+        "ignore": ["*.pyc", "build"],
+    }
+}
+_NO_FILES_KIT = {"workspace": {}}
+
+# --- Fixtures ---
+
+@pytest.fixture
+def patch_read_kit(monkeypatch: pytest.MonkeyPatch):
+    """Make YAMLUtils.read_kit return the given kit dict. The service appends to
+    the ignore list, so every call hands out a copy of the shared constant."""
+    def _patch(kit: dict):
+        monkeypatch.setattr(YAMLUtils, "read_kit", lambda module_path: copy.deepcopy(kit))
+    return _patch
+
+@pytest.fixture
+def workspace_path(tmp_path: Path) -> Path:
+    path = tmp_path / "workspaces" / TEST_WORKSPACE
+    (path / "docs").mkdir(parents=True)
+    (path / "src" / "build").mkdir(parents=True)
+    (path / ".git").mkdir()
+    (path / "docs" / "guide.md").write_text("# Guide")
+    (path / "src" / "main.py").write_text("print('main')")
+    (path / "src" / "build" / "generated.py").write_text("# generated")
+    (path / ".git" / "hook.py").write_text("# git internals")
+    return path
+
+@pytest.fixture
+def resource_service(tmp_path: Path, workspace_path: Path) -> ResourceService:
+    module_service = Mock(spec=ModuleService)
+    module_service.get_module_metadata.return_value = SimpleNamespace(workspace_name=TEST_WORKSPACE)
+    module_service.get_module_path.return_value = tmp_path / "modules" / TEST_MODULE_ID
+    return ResourceService(
+        module_base=tmp_path / "modules",
+        workspace_base=workspace_path.parent,
+        module_service=module_service,
+        model_service=Mock(spec=ModelService)
+    )
+
+# --- Test Cases ---
+
+class TestResourceService:
+
+    def test_list_workspace_paths(self, resource_service: ResourceService, patch_read_kit):
+        patch_read_kit(_DOCS_KIT)
+
+        paths = resource_service.list_workspace_paths(TEST_MODULE_ID)
+
+        # Sorted by path; .git and the kit's ignore patterns are skipped
+        assert [p["path"] for p in paths] == ["docs/guide.md", "src/main.py"]
+        assert paths[0]["name"] == "guide.md"
+        assert paths[0]["size"] == len("# Guide")
+
+    def test_list_workspace_paths_no_files(self, resource_service: ResourceService, patch_read_kit):
+        patch_read_kit(_NO_FILES_KIT)
+        assert resource_service.list_workspace_paths(TEST_MODULE_ID) == []
+
+    def test_list_workspace_paths_module_error(self, resource_service: ResourceService, patch_read_kit):
+        patch_read_kit(_DOCS_KIT)
+        resource_service.module_service.get_module_metadata.side_effect = ModuleError("Module not found")
+
+        with pytest.raises(ResourceError, match="Module not found"):
+            resource_service.list_workspace_paths(TEST_MODULE_ID)
+
+    def test_get_workspace_resources(self, resource_service: ResourceService, patch_read_kit):
+        patch_read_kit(_DOCS_KIT)
+
+        resources = resource_service.get_workspace_resources(TEST_MODULE_ID)
+
+        by_path = {r.path: r for r in resources}
+        assert "src/main.py" in by_path
+        assert ".git/hook.py" not in by_path
+        assert all(isinstance(r, Resource) for r in resources)
+        assert by_path["docs/guide.md"].content == "# Guide"
+        assert by_path["docs/guide.md"].description == "Documentation"
+
+    def test_get_workspace_file(self, resource_service: ResourceService):
+        content, mime_type = resource_service.get_workspace_file(TEST_MODULE_ID, "src/main.py")
+
+        assert content == b"print('main')"
+        assert mime_type == "text/x-python"
+
+    def test_get_workspace_file_not_found(self, resource_service: ResourceService):
+        with pytest.raises(ResourceError, match="File not found: missing.txt"):
+            resource_service.get_workspace_file(TEST_MODULE_ID, "missing.txt")
+
+    def test_get_workspace_file_unsafe_path(self, resource_service: ResourceService):
+        with pytest.raises(ResourceError, match="Access denied"):
+            resource_service.get_workspace_file(TEST_MODULE_ID, "../outside.txt")
@@ -10,30 +10,51 @@ from engine.utils.file import is_safe_path, extract_zip
 from engine.utils.readable_uid import generate_readable_uid
 from engine.utils.yaml import YAMLUtils, YAMLError
 
-class TestFileUtil:
-
-    def test_is_safe_path_valid(self, tmp_path: Path):
-        base_path = tmp_path
-        safe_file_path = "subdir/safe_file.txt"
-        safe_nonexistent_path = "another_dir/new_file.txt"
-
-        # Create necessary parent directory for the check
-        (base_path / "subdir").mkdir()
-        (base_path / "another_dir").mkdir()
+@pytest.fixture(scope="module")
+def safe_base_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Base dir shared by the is_safe_path cases."""
+    base_path = tmp_path_factory.mktemp("safe_base")
+    (base_path / "subdir").mkdir()
+    (base_path / "another_dir").mkdir()
+    return base_path
 
-        assert is_safe_path(base_path, safe_file_path) is True
-        assert is_safe_path(base_path, safe_nonexistent_path) is True
-
-    def test_is_safe_path_invalid(self, tmp_path: Path):
-        base_path = tmp_path
-        # Path traversal
-        assert is_safe_path(base_path, "../outside.txt") is False
-        assert is_safe_path(base_path, "subdir/../../outside.txt") is False
-        # Absolute paths
-        assert is_safe_path(base_path, "/etc/passwd") is False
-        # Path starting with ..
-        assert is_safe_path(base_path, "..\\secrets.txt") is False
+class TestFileUtil:
 
+    @pytest.mark.parametrize("file_path, expected", [
+        ("subdir/safe_file.txt", True),
+        ("another_dir/new_file.txt", True), # Non-existent file in an existing dir
+        ("../outside.txt", False), # Path traversal
+        ("subdir/../../outside.txt", False),
+        ("/etc/passwd", False), # Absolute paths
+        ("..\\secrets.txt", False), # Path starting with ..
+    ])
+    def test_is_safe_path(self, safe_base_path: Path, file_path: str, expected: bool):
+        assert is_safe_path(safe_base_path, file_path) is expected
+
+    def test_is_safe_path_relative_base_follows_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        (tmp_path / "first" / "ws").mkdir(parents=True)
+        (tmp_path / "second" / "ws").mkdir(parents=True)
+        (tmp_path / "second" / "ws" / "link").symlink_to(tmp_path / "outside")
+
+        monkeypatch.chdir(tmp_path / "first")
+        assert is_safe_path(Path("ws"), "link") is True
+
+        # The same relative base now names a dir whose "link" escapes it
+        monkeypatch.chdir(tmp_path / "second")
+        assert is_safe_path(Path("ws"), "link") is False
+
+    def test_is_safe_path_follows_retargeted_symlink_base(self, tmp_path: Path):
+        (tmp_path / "first").mkdir()
+        (tmp_path / "second").mkdir()
+        (tmp_path / "second" / "link").symlink_to(tmp_path / "outside")
+        base_path = tmp_path / "ws"
+        base_path.symlink_to(tmp_path / "first")
+
+        assert is_safe_path(base_path, "link") is True
+
+        base_path.unlink()
+        base_path.symlink_to(tmp_path / "second")
+        assert is_safe_path(base_path, "link") is False
 
     def test_extract_zip(self, tmp_path: Path):
         zip_content_dir = tmp_path / "zip_content"